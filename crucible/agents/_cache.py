@@ -0,0 +1,164 @@
+"""
+LLM caching helpers for agents.
+
+Agents configured with cache_responses=True and temperature 0 get the same
+answer for the same prompt, so repeated calls can be served from memory.
+Sampled calls (temperature > 0) are never cached, and caching is off by
+default.
+"""
+
+import dataclasses
+import hashlib
+import json
+import logging
+from typing import Any, Optional
+
+from kosmos.core.cache import InMemoryCache
+from kosmos.core.providers.base import LLMResponse
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """In-memory LRU cache of LLM responses keyed on model, prompts and temperature."""
+
+    def __init__(self, max_size: int = 256, ttl_seconds: int = 3600):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Maximum number of responses to keep
+            ttl_seconds: Time-to-live for cached responses in seconds
+        """
+        self._cache = InMemoryCache(max_size=max_size, ttl_seconds=ttl_seconds)
+
+    @staticmethod
+    def cache_key(
+        model: Any,
+        system: Optional[str],
+        prompt: str,
+        temperature: float
+    ) -> Optional[str]:
+        """
+        Build the cache key for an LLM call.
+
+        Returns:
+            sha256 hex digest, or None if the call is sampled (temperature > 0)
+            and must not be cached
+        """
+        if temperature > 0:
+            return None
+        key_data = {
+            "model": model,
+            "system": system,
+            "prompt": prompt,
+            "temperature": temperature,
+        }
+        key_str = json.dumps(key_data, sort_keys=True, default=str)
+        return hashlib.sha256(key_str.encode()).hexdigest()
+
+    def get(self, key: Optional[str]) -> Optional[LLMResponse]:
+        """Return the cached response for key, or None."""
+        if key is None:
+            return None
+        return self._cache.get(key)
+
+    def set(self, key: Optional[str], response: LLMResponse) -> None:
+        """Cache response under key; no-op when key is None."""
+        if key is not None:
+            self._cache.set(key, response)
+
+    def clear(self) -> int:
+        """Drop all cached responses. Returns the number removed."""
+        return self._cache.clear()
+
+
+_llm_cache: Optional[LLMCache] = None
+
+
+def get_llm_cache() -> LLMCache:
+    """Get or create the process-wide agent LLM cache."""
+    global _llm_cache
+    if _llm_cache is None:
+        _llm_cache = LLMCache()
+    return _llm_cache
+
+
+def reset_llm_cache() -> None:
+    """Discard the process-wide agent LLM cache (used by tests)."""
+    global _llm_cache
+    _llm_cache = None
+
+
+def _as_cache_hit(response: LLMResponse) -> LLMResponse:
+    """
+    Copy of a cached response with zero token usage.
+
+    The tokens were already reported for the original call; callers that
+    record usage as cost must not bill them again.
+    """
+    usage = dataclasses.replace(
+        response.usage,
+        input_tokens=0,
+        output_tokens=0,
+        total_tokens=0,
+        cost_usd=0.0 if response.usage.cost_usd is not None else None,
+    )
+    metadata = {**(response.metadata or {}), "cache_hit": True}
+    return dataclasses.replace(response, usage=usage, metadata=metadata)
+
+
+def generate_cached(
+    llm_provider: Any,
+    prompt: str,
+    system: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    use_cache: bool = False
+) -> LLMResponse:
+    """
+    Call llm_provider.generate, serving deterministic calls from the cache.
+
+    A cache hit returns a copy of the stored response with zero usage and
+    metadata["cache_hit"] set.
+
+    Args:
+        llm_provider: Provider to call on a cache miss
+        prompt: User prompt
+        system: System prompt
+        temperature: Sampling temperature; only 0 is cached
+        max_tokens: Maximum tokens to generate
+        use_cache: Whether the caller opted in to response caching
+
+    Returns:
+        The cached or freshly generated LLMResponse
+    """
+    if not use_cache:
+        return llm_provider.generate(
+            prompt,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens
+        )
+
+    cache = get_llm_cache()
+    model = (
+        getattr(llm_provider, "provider_name", None),
+        getattr(llm_provider, "model", None),
+    )
+    key = cache.cache_key(model, system, prompt, temperature)
+
+    cached = cache.get(key)
+    if cached is not None:
+        logger.debug("Serving LLM response from agent cache")
+        return _as_cache_hit(cached)
+
+    response = llm_provider.generate(
+        prompt,
+        system=system,
+        temperature=temperature,
+        max_tokens=max_tokens
+    )
+    cache.set(key, response)
+    return response
+
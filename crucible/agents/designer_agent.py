@@ -13,6 +13,7 @@ from typing import Dict, Any, List, Optional
 from kosmos.agents.base import BaseAgent
 from kosmos.core.llm import get_provider
 
+from crucible.utils.llm_json import parse_llm_json
 from crucible.utils.llm_usage import usage_stats_to_dict
 
 logger = logging.getLogger(__name__)
@@ -82,26 +83,12 @@ class DesignerAgent(BaseAgent):
                 max_tokens=4096
             )
 
-            # Parse LLM response (may need to extract JSON from markdown code blocks)
-            content = response.content.strip()
-            
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                if end > start:
-                    content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                if end > start:
-                    content = content[start:end].strip()
-            
             try:
-                result = json.loads(content)
+                # The LLM may wrap its JSON in a markdown code block
+                result = parse_llm_json(response.content)
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse LLM response as JSON: {e}")
-                logger.error(f"Response content: {content[:500]}")
+                logger.error(f"Response content: {response.content[:500]}")
                 # Return a safe default
                 result = {
                     "candidates": [],
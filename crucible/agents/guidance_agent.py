@@ -15,6 +15,8 @@ from typing import Dict, Any, Optional, List, Callable
 
 from kosmos.agents.base import BaseAgent
 from kosmos.core.llm import get_provider
+
+from crucible.agents._cache import generate_cached
 from crucible.core.tool_calling import ToolCallingExecutor
 
 logger = logging.getLogger(__name__)
@@ -249,11 +251,13 @@ class GuidanceAgent(BaseAgent):
             initial_state=initial_state
         )
         
-        response = self.llm_provider.generate(
+        response = generate_cached(
+            self.llm_provider,
             prompt,
             system=self._get_system_prompt_with_tools(),
-            temperature=0.8,
-            max_tokens=2048
+            temperature=self.config.get("temperature", 0.8),
+            max_tokens=2048,
+            use_cache=self.config.get("cache_responses", False)
         )
         
         guidance_message = response.content.strip()
@@ -293,11 +297,13 @@ class GuidanceAgent(BaseAgent):
             chat_context
         )
 
-        response = self.llm_provider.generate(
+        response = generate_cached(
+            self.llm_provider,
             prompt,
             system=self._get_system_prompt(),
-            temperature=0.8,
-            max_tokens=2048
+            temperature=self.config.get("temperature", 0.8),
+            max_tokens=2048,
+            use_cache=self.config.get("cache_responses", False)
         )
 
         guidance_message = response.content.strip()
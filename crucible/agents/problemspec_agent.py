@@ -13,8 +13,28 @@ from typing import Dict, Any, List, Optional
 from kosmos.agents.base import BaseAgent
 from kosmos.core.llm import get_provider
 
+from crucible.agents._cache import generate_cached
+from crucible.utils.llm_json import parse_llm_json
+
 logger = logging.getLogger(__name__)
 
+# Static instructions, kept out of the per-call prompt so providers can cache them
+_SYSTEM_PROMPT = "\n".join([
+    "You are a ProblemSpec refinement agent for Int Crucible.",
+    "Your role is to help structure problem descriptions into a ProblemSpec.",
+    "",
+    "A ProblemSpec contains:",
+    "- constraints: Array of {name, description, weight (0-100)}",
+    "- goals: Array of goal descriptions (strings)",
+    "- resolution: One of 'coarse', 'medium', 'fine'",
+    "- mode: One of 'full_search', 'eval_only', 'seeded'",
+    "",
+    "IMPORTANT: Be conservative about overwriting user-provided constraints.",
+    "Propose additions and refinements, but preserve user intent.",
+    "",
+    "Always respond with valid JSON only.",
+])
+
 
 class ProblemSpecAgent(BaseAgent):
     """
@@ -67,33 +87,21 @@ class ProblemSpecAgent(BaseAgent):
             )
 
             # Call LLM for structured response
-            response = self.llm_provider.generate(
+            response = generate_cached(
+                self.llm_provider,
                 prompt,
-                system="You are a ProblemSpec refinement agent. Always respond with valid JSON only.",
-                temperature=0.3,  # Lower temperature for more consistent structured output
-                max_tokens=4096
+                system=_SYSTEM_PROMPT,
+                # Lower temperature for more consistent structured output
+                temperature=self.config.get("temperature", 0.3),
+                max_tokens=4096,
+                use_cache=self.config.get("cache_responses", False)
             )
 
-            # Parse LLM response (may need to extract JSON from markdown code blocks)
-            content = response.content.strip()
-            
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                if end > start:
-                    content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                if end > start:
-                    content = content[start:end].strip()
-            
             try:
-                result = json.loads(content)
+                result = parse_llm_json(response.content)
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse LLM response as JSON: {e}")
-                logger.error(f"Response content: {content[:500]}")
+                logger.error(f"Response content: {response.content[:500]}")
                 # Return a safe default
                 result = {
                     "updated_spec": current_spec or {},
@@ -121,20 +129,7 @@ class ProblemSpecAgent(BaseAgent):
     ) -> str:
         """Build the prompt for ProblemSpec refinement."""
         
-        prompt_parts = [
-            "You are a ProblemSpec refinement agent for Int Crucible.",
-            "Your role is to help structure problem descriptions into a ProblemSpec.",
-            "",
-            "A ProblemSpec contains:",
-            "- constraints: Array of {name, description, weight (0-100)}",
-            "- goals: Array of goal descriptions (strings)",
-            "- resolution: One of 'coarse', 'medium', 'fine'",
-            "- mode: One of 'full_search', 'eval_only', 'seeded'",
-            "",
-            "IMPORTANT: Be conservative about overwriting user-provided constraints.",
-            "Propose additions and refinements, but preserve user intent.",
-            "",
-        ]
+        prompt_parts = []
 
         if project_description:
             prompt_parts.extend([
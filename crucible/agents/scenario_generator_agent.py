@@ -13,10 +13,27 @@ from typing import Dict, Any, List, Optional
 from kosmos.agents.base import BaseAgent
 from kosmos.core.llm import get_provider
 
+from crucible.agents._cache import generate_cached
+from crucible.utils.llm_json import parse_llm_json
 from crucible.utils.llm_usage import usage_stats_to_dict
 
 logger = logging.getLogger(__name__)
 
+# Static instructions, kept out of the per-call prompt so providers can cache them
+_SYSTEM_PROMPT = "\n".join([
+    "You are a ScenarioGenerator agent for Int Crucible.",
+    "Your role is to generate scenarios that stress-test candidates against critical constraints and assumptions.",
+    "",
+    "IMPORTANT:",
+    "- Focus on scenarios that stress HIGH-WEIGHT constraints and FRAGILE assumptions.",
+    "- Generate scenarios that will reveal weaknesses in candidate solutions.",
+    "- Include a mix of: stress tests, edge cases, normal operation, and failure modes.",
+    "- For MVP, aim for 5-10 well-targeted scenarios.",
+    "- Each scenario should be structured enough for evaluators to consume.",
+    "",
+    "Always respond with valid JSON only.",
+])
+
 
 class ScenarioGeneratorAgent(BaseAgent):
     """
@@ -80,33 +97,21 @@ class ScenarioGeneratorAgent(BaseAgent):
             )
 
             # Call LLM for structured response
-            response = self.llm_provider.generate(
+            response = generate_cached(
+                self.llm_provider,
                 prompt,
-                system="You are a ScenarioGenerator agent for Int Crucible. Always respond with valid JSON only.",
-                temperature=0.5,  # Moderate temperature for balanced creativity and consistency
-                max_tokens=4096
+                system=_SYSTEM_PROMPT,
+                # Moderate temperature for balanced creativity and consistency
+                temperature=self.config.get("temperature", 0.5),
+                max_tokens=4096,
+                use_cache=self.config.get("cache_responses", False)
             )
 
-            # Parse LLM response (may need to extract JSON from markdown code blocks)
-            content = response.content.strip()
-            
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                if end > start:
-                    content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                if end > start:
-                    content = content[start:end].strip()
-            
             try:
-                result = json.loads(content)
+                result = parse_llm_json(response.content)
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse LLM response as JSON: {e}")
-                logger.error(f"Response content: {content[:500]}")
+                logger.error(f"Response content: {response.content[:500]}")
                 # Return a safe default
                 result = {
                     "scenarios": [],
@@ -134,18 +139,7 @@ class ScenarioGeneratorAgent(BaseAgent):
     ) -> str:
         """Build the prompt for scenario generation."""
         
-        prompt_parts = [
-            "You are a ScenarioGenerator agent for Int Crucible.",
-            "Your role is to generate scenarios that stress-test candidates against critical constraints and assumptions.",
-            "",
-            "IMPORTANT:",
-            "- Focus on scenarios that stress HIGH-WEIGHT constraints and FRAGILE assumptions.",
-            "- Generate scenarios that will reveal weaknesses in candidate solutions.",
-            "- Include a mix of: stress tests, edge cases, normal operation, and failure modes.",
-            "- For MVP, aim for 5-10 well-targeted scenarios.",
-            "- Each scenario should be structured enough for evaluators to consume.",
-            "",
-        ]
+        prompt_parts = []
 
         if problem_spec:
             prompt_parts.extend([
@@ -14,8 +14,73 @@ from datetime import datetime
 from kosmos.agents.base import BaseAgent
 from kosmos.core.llm import get_provider
 
+from crucible.utils import fast_json
+from crucible.utils.llm_json import parse_llm_json
+
 logger = logging.getLogger(__name__)
 
+# Top-level WorldModel sections, each holding a list of entries
+_WORLD_MODEL_SECTIONS = (
+    "actors",
+    "mechanisms",
+    "resources",
+    "constraints",
+    "assumptions",
+    "simplifications",
+    "provenance",
+)
+
+# Static prompt sections, joined once at import; only the context between them varies
+_PROMPT_PREAMBLE = "\n".join([
+    "You are a WorldModeller agent for Int Crucible.",
+    "Your role is to build a structured world model from a ProblemSpec and chat context.",
+    "",
+    "A WorldModel contains:",
+    "- actors: Entities that act in the system (people, systems, organizations)",
+    "- mechanisms: Processes, systems, or algorithms that transform inputs to outputs",
+    "- resources: Materials, energy, information, time, or other resources needed",
+    "- constraints: Limitations or requirements (can reference ProblemSpec constraints)",
+    "- assumptions: Things we assume to be true",
+    "- simplifications: What we're simplifying or approximating",
+    "",
+    "IMPORTANT:",
+    "- Be conservative about overwriting existing model elements.",
+    "- Propose additions and refinements, but preserve existing structure.",
+    "- Focus on elements that are most relevant for scenario generation and evaluation.",
+    "- For MVP, aim for 'usable but not exhaustive' - include key elements, skip less-critical details.",
+    "",
+])
+
+_PROMPT_RESPONSE_FORMAT = "\n".join([
+    "Based on the above context:",
+    "1. Propose an updated WorldModel (JSON structure)",
+    "2. Generate a list of changes with provenance info",
+    "3. Explain your reasoning",
+    "4. Indicate if the model is ready_to_run (has sufficient detail for scenario generation)",
+    "",
+    "Respond with a JSON object:",
+    "{",
+    '  "updated_model": {',
+    '    "actors": [...],',
+    '    "mechanisms": [...],',
+    '    "resources": [...],',
+    '    "constraints": [...],',
+    '    "assumptions": [...],',
+    '    "simplifications": [...]',
+    "  },",
+    '  "changes": [',
+    '    {',
+    '      "type": "add|update|remove",',
+    '      "entity_type": "actor|mechanism|resource|constraint|assumption|simplification",',
+    '      "entity_id": "id",',
+    '      "description": "what changed and why"',
+    '    }',
+    "  ],",
+    '  "reasoning": "explanation of changes",',
+    '  "ready_to_run": false',
+    "}",
+])
+
 
 class WorldModellerAgent(BaseAgent):
     """
@@ -79,26 +144,19 @@ class WorldModellerAgent(BaseAgent):
                 max_tokens=4096
             )
 
-            # Parse LLM response (may need to extract JSON from markdown code blocks)
-            content = response.content.strip()
-            
-            # Try to extract JSON from markdown code blocks if present
-            if "```json" in content:
-                start = content.find("```json") + 7
-                end = content.find("```", start)
-                if end > start:
-                    content = content[start:end].strip()
-            elif "```" in content:
-                start = content.find("```") + 3
-                end = content.find("```", start)
-                if end > start:
-                    content = content[start:end].strip()
-            
             try:
-                result = json.loads(content)
+                # The LLM may wrap its JSON in a markdown code block
+                result = parse_llm_json(response.content)
             except json.JSONDecodeError as e:
                 logger.error(f"Failed to parse LLM response as JSON: {e}")
-                logger.error(f"Response content: {content[:500]}")
+                result = None
+            else:
+                if not isinstance(result, dict):
+                    logger.error(f"Expected a JSON object from LLM, got {type(result).__name__}")
+                    result = None
+
+            if result is None:
+                logger.error(f"Response content: {response.content[:500]}")
                 # Return a safe default
                 result = {
                     "updated_model": current_model or self._empty_model(),
@@ -119,16 +177,8 @@ class WorldModellerAgent(BaseAgent):
             raise
 
     def _empty_model(self) -> Dict[str, Any]:
-        """Return an empty WorldModel structure."""
-        return {
-            "actors": [],
-            "mechanisms": [],
-            "resources": [],
-            "constraints": [],
-            "assumptions": [],
-            "simplifications": [],
-            "provenance": []
-        }
+        """Return an empty WorldModel structure (fresh lists; callers may mutate them)."""
+        return {key: [] for key in _WORLD_MODEL_SECTIONS}
 
     def _build_modeling_prompt(
         self,
@@ -139,25 +189,7 @@ class WorldModellerAgent(BaseAgent):
     ) -> str:
         """Build the prompt for WorldModel generation/refinement."""
         
-        prompt_parts = [
-            "You are a WorldModeller agent for Int Crucible.",
-            "Your role is to build a structured world model from a ProblemSpec and chat context.",
-            "",
-            "A WorldModel contains:",
-            "- actors: Entities that act in the system (people, systems, organizations)",
-            "- mechanisms: Processes, systems, or algorithms that transform inputs to outputs",
-            "- resources: Materials, energy, information, time, or other resources needed",
-            "- constraints: Limitations or requirements (can reference ProblemSpec constraints)",
-            "- assumptions: Things we assume to be true",
-            "- simplifications: What we're simplifying or approximating",
-            "",
-            "IMPORTANT:",
-            "- Be conservative about overwriting existing model elements.",
-            "- Propose additions and refinements, but preserve existing structure.",
-            "- Focus on elements that are most relevant for scenario generation and evaluation.",
-            "- For MVP, aim for 'usable but not exhaustive' - include key elements, skip less-critical details.",
-            "",
-        ]
+        prompt_parts = [_PROMPT_PREAMBLE]
 
         if project_description:
             prompt_parts.extend([
@@ -168,7 +200,7 @@ class WorldModellerAgent(BaseAgent):
         if problem_spec:
             prompt_parts.extend([
                 "ProblemSpec:",
-                json.dumps(problem_spec, indent=2),
+                fast_json.dumps(problem_spec, indent=True),
                 "",
             ])
         else:
@@ -178,7 +210,7 @@ class WorldModellerAgent(BaseAgent):
         if current_model:
             prompt_parts.extend([
                 "Current WorldModel:",
-                json.dumps(current_model, indent=2),
+                fast_json.dumps(current_model, indent=True),
                 "",
             ])
         else:
@@ -198,35 +230,7 @@ class WorldModellerAgent(BaseAgent):
             prompt_parts.append("No chat messages yet.")
             prompt_parts.append("")
 
-        prompt_parts.extend([
-            "Based on the above context:",
-            "1. Propose an updated WorldModel (JSON structure)",
-            "2. Generate a list of changes with provenance info",
-            "3. Explain your reasoning",
-            "4. Indicate if the model is ready_to_run (has sufficient detail for scenario generation)",
-            "",
-            "Respond with a JSON object:",
-            "{",
-            '  "updated_model": {',
-            '    "actors": [...],',
-            '    "mechanisms": [...],',
-            '    "resources": [...],',
-            '    "constraints": [...],',
-            '    "assumptions": [...],',
-            '    "simplifications": [...]',
-            "  },",
-            '  "changes": [',
-            '    {',
-            '      "type": "add|update|remove",',
-            '      "entity_type": "actor|mechanism|resource|constraint|assumption|simplification",',
-            '      "entity_id": "id",',
-            '      "description": "what changed and why"',
-            '    }',
-            "  ],",
-            '  "reasoning": "explanation of changes",',
-            '  "ready_to_run": false',
-            "}",
-        ])
+        prompt_parts.append(_PROMPT_RESPONSE_FORMAT)
 
         return "\n".join(prompt_parts)
 
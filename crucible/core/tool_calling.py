@@ -13,11 +13,15 @@ from dataclasses import dataclass
 
 from kosmos.core.providers.base import LLMProvider, LLMResponse
 from crucible.core.tools import generate_tool_schemas, convert_to_anthropic_format, convert_to_openai_format
+from crucible.utils import fast_json
 
 logger = logging.getLogger(__name__)
 
+# Argument names containing any of these (case-insensitive) are redacted in audit logs
+_SENSITIVE_ARGUMENT_SUBSTRINGS = ('password', 'api_key', 'secret', 'token', 'key')
 
-@dataclass
+
+@dataclass(slots=True)
 class ToolCall:
     """Represents a tool call request."""
     tool_name: str
@@ -25,7 +29,7 @@ class ToolCall:
     call_id: Optional[str] = None  # For Anthropic tool use
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Represents the result of a tool call."""
     tool_name: str
@@ -35,7 +39,7 @@ class ToolResult:
     duration_ms: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolCallAudit:
     """Audit log entry for a tool call."""
     tool_name: str
@@ -83,6 +87,10 @@ class ToolCallingExecutor:
         # Generate tool schemas
         self.tool_schemas = generate_tool_schemas(tools)
         
+        # Provider-format schemas are sent unchanged on every iteration, so convert once
+        self._openai_schemas = [convert_to_openai_format(schema) for schema in self.tool_schemas]
+        self._anthropic_schemas = [convert_to_anthropic_format(schema) for schema in self.tool_schemas]
+        
         # Detect provider type
         self.provider_name = self._detect_provider_type()
         logger.info(f"ToolCallingExecutor initialized with {len(tools)} tools for {self.provider_name} provider")
@@ -211,17 +219,15 @@ class ToolCallingExecutor:
             return "null"
         
         if isinstance(result, str):
-            # Truncate long strings
-            return result[:200] + "..." if len(result) > 200 else result
-        
-        if isinstance(result, (dict, list)):
-            # Convert to JSON string and truncate
-            json_str = json.dumps(result, default=str)
-            return json_str[:200] + "..." if len(json_str) > 200 else json_str
+            summary = result
+        elif isinstance(result, (dict, list)):
+            # Compact JSON; non-serializable values fall back to str()
+            summary = fast_json.dumps(result, default=str)
+        else:
+            summary = str(result)
         
-        # For other types, convert to string
-        result_str = str(result)
-        return result_str[:200] + "..." if len(result_str) > 200 else result_str
+        # Truncate long summaries
+        return summary if len(summary) <= 200 else summary[:200] + "..."
     
     def _redact_arguments(self, arguments: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -233,17 +239,10 @@ class ToolCallingExecutor:
         Returns:
             Redacted arguments dict
         """
-        # Sensitive field names (can be enhanced with config)
-        sensitive_fields = {'password', 'api_key', 'secret', 'token', 'key'}
-        
-        redacted = {}
-        for key, value in arguments.items():
-            if any(sensitive in key.lower() for sensitive in sensitive_fields):
-                redacted[key] = "[REDACTED]"
-            else:
-                redacted[key] = value
-        
-        return redacted
+        return {
+            key: "[REDACTED]" if any(sensitive in key.lower() for sensitive in _SENSITIVE_ARGUMENT_SUBSTRINGS) else value
+            for key, value in arguments.items()
+        }
     
     def execute_with_tools(
         self,
@@ -384,8 +383,7 @@ class ToolCallingExecutor:
                     raise ValueError("ANTHROPIC_API_KEY not found")
                 client = Anthropic(api_key=api_key)
             
-            # Convert tool schemas to Anthropic format
-            anthropic_tools = [convert_to_anthropic_format(schema) for schema in self.tool_schemas]
+            anthropic_tools = self._anthropic_schemas
             
             # Convert messages to Anthropic format (handle tool_use blocks)
             anthropic_messages = []
@@ -519,62 +517,9 @@ class ToolCallingExecutor:
                     raise ValueError("OPENAI_API_KEY not found")
                 client = OpenAI(api_key=api_key, base_url=base_url) if base_url else OpenAI(api_key=api_key)
             
-            # Convert tool schemas to OpenAI format
-            openai_tools = [convert_to_openai_format(schema) for schema in self.tool_schemas]
+            openai_tools = self._openai_schemas
             
-            # Convert messages to OpenAI format
-            openai_messages = []
-            for msg in messages:
-                role = msg.get("role")
-                if role == "system":
-                    # System messages are handled separately in OpenAI
-                    continue
-                elif role == "assistant" and msg.get("tool_calls"):
-                    # Assistant message with tool calls
-                    message = {
-                        "role": "assistant",
-                        "content": msg.get("content") or None,
-                        "tool_calls": [
-                            {
-                                "id": tc.get("id", f"call_{i}"),
-                                "type": "function",
-                                "function": {
-                                    "name": tc["name"],
-                                    "arguments": json.dumps(tc["arguments"])
-                                }
-                            }
-                            for i, tc in enumerate(msg.get("tool_calls", []))
-                        ]
-                    }
-                    openai_messages.append(message)
-                elif role == "tool":
-                    # Tool result message
-                    openai_messages.append({
-                        "role": "tool",
-                        "tool_call_id": msg.get("tool_call_id"),
-                        "content": json.dumps(msg.get("content", {}), default=str)
-                    })
-                else:
-                    # Regular user message
-                    if isinstance(msg.get("content"), dict):
-                        # Handle tool results embedded in user message (legacy format)
-                        tool_results = msg.get("content", {}).get("tool_results", [])
-                        for tr in tool_results:
-                            tool_call_id = tr.get("tool_call_id", tr.get("id", f"call_{len(openai_messages)}"))
-                            if "error" in tr:
-                                content = json.dumps({"error": tr["error"]}, default=str)
-                            else:
-                                content = json.dumps(tr.get("result", {}), default=str)
-                            openai_messages.append({
-                                "role": "tool",
-                                "tool_call_id": tool_call_id,
-                                "content": content
-                            })
-                    else:
-                        openai_messages.append({
-                            "role": role,
-                            "content": msg.get("content", "")
-                        })
+            openai_messages = self._convert_messages_openai(messages)
             
             # Add system prompt as first message if provided
             if system_prompt:
@@ -663,6 +608,69 @@ class ToolCallingExecutor:
             result["error"] = tool_result.error
         return result
     
+    def _convert_messages_openai(self, messages: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Convert conversation messages to OpenAI chat format.
+        
+        System messages are dropped; the caller passes the system prompt
+        separately. Assistant tool calls may be internal ToolCall dicts
+        (name/arguments) or entries already in OpenAI wire format.
+        """
+        openai_messages = []
+        for msg in messages:
+            role = msg.get("role")
+            if role == "system":
+                # System messages are handled separately in OpenAI
+                continue
+            elif role == "assistant" and msg.get("tool_calls"):
+                # Assistant message with tool calls
+                # Entries copied from a raw OpenAI response are already in wire format
+                message = {
+                    "role": "assistant",
+                    "content": msg.get("content") or None,
+                    "tool_calls": [
+                        tc if "function" in tc else {
+                            "id": tc.get("id", f"call_{i}"),
+                            "type": "function",
+                            "function": {
+                                "name": tc["name"],
+                                "arguments": json.dumps(tc["arguments"])
+                            }
+                        }
+                        for i, tc in enumerate(msg.get("tool_calls", []))
+                    ]
+                }
+                openai_messages.append(message)
+            elif role == "tool":
+                # Tool result message
+                openai_messages.append({
+                    "role": "tool",
+                    "tool_call_id": msg.get("tool_call_id"),
+                    "content": json.dumps(msg.get("content", {}), default=str)
+                })
+            else:
+                # Regular user message
+                if isinstance(msg.get("content"), dict):
+                    # Handle tool results embedded in user message (legacy format)
+                    tool_results = msg.get("content", {}).get("tool_results", [])
+                    for tr in tool_results:
+                        tool_call_id = tr.get("tool_call_id", tr.get("id", f"call_{len(openai_messages)}"))
+                        if "error" in tr:
+                            content = json.dumps({"error": tr["error"]}, default=str)
+                        else:
+                            content = json.dumps(tr.get("result", {}), default=str)
+                        openai_messages.append({
+                            "role": "tool",
+                            "tool_call_id": tool_call_id,
+                            "content": content
+                        })
+                else:
+                    openai_messages.append({
+                        "role": role,
+                        "content": msg.get("content", "")
+                    })
+        return openai_messages
+    
     def _format_tool_result_message_openai(self, tool_result: Dict[str, Any]) -> Dict[str, Any]:
         """Format tool result as OpenAI tool role message."""
         tool_call_id = tool_result.get("tool_call_id", "unknown")
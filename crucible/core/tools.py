@@ -5,6 +5,7 @@ Generates tool schemas from Python functions for LLM function calling.
 Supports both Anthropic tool use format and OpenAI function calling format.
 """
 
+import functools
 import inspect
 import logging
 from typing import Dict, Any, Callable, Optional, List, Type, get_type_hints, get_origin, get_args
@@ -30,8 +31,15 @@ def get_json_schema_type(python_type: Type) -> Dict[str, Any]:
         python_type: Python type annotation
         
     Returns:
-        JSON schema type definition dict
+        JSON schema type definition dict. The dict is shared through a cache,
+        so copy it before modifying.
     """
+    return _json_schema_type(python_type)
+
+
+@functools.lru_cache(maxsize=256)
+def _json_schema_type(python_type: Type) -> Dict[str, Any]:
+    """Memoized conversion behind get_json_schema_type; results are shared, never modify them."""
     # Handle Optional/Union types
     origin = get_origin(python_type)
     if origin is Optional or (origin is type(None).__class__):
@@ -40,7 +48,7 @@ def get_json_schema_type(python_type: Type) -> Dict[str, Any]:
         if args:
             non_none_type = [a for a in args if a is not type(None)]
             if non_none_type:
-                schema = get_json_schema_type(non_none_type[0])
+                schema = dict(_json_schema_type(non_none_type[0]))
                 schema["type"] = [schema["type"], "null"] if isinstance(schema.get("type"), str) else schema.get("type", []) + ["null"]
                 return schema
     
@@ -50,13 +58,13 @@ def get_json_schema_type(python_type: Type) -> Dict[str, Any]:
         if args:
             types = [t for t in args if t is not type(None)]
             if types:
-                json_types = [get_json_schema_type(t).get("type", "string") for t in types]
+                json_types = [_json_schema_type(t).get("type", "string") for t in types]
                 return {"type": json_types[0] if len(json_types) == 1 else json_types}
     
     # Handle List types
     if origin is list or python_type is list:
         args = get_args(python_type)
-        items_type = get_json_schema_type(args[0]) if args else {"type": "string"}
+        items_type = _json_schema_type(args[0]) if args else {"type": "string"}
         return {"type": "array", "items": items_type}
     
     # Handle Dict types
@@ -113,8 +121,8 @@ def generate_tool_schema(func: Callable, tool_name: Optional[str] = None) -> Dic
         # Get parameter type
         param_type = type_hints.get(param_name, str)
         
-        # Convert to JSON schema
-        param_schema = get_json_schema_type(param_type)
+        # Convert to JSON schema (copied, since default/description are added below)
+        param_schema = dict(get_json_schema_type(param_type))
         
         # Get default value
         if param.default is not inspect.Parameter.empty:
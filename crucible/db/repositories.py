@@ -7,6 +7,7 @@ Provides basic CRUD operations for all core entities.
 import uuid
 from datetime import datetime
 
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from crucible.db.models import (
@@ -666,6 +667,39 @@ def create_snapshot(
     return snapshot
 
 
+def create_snapshots(session: Session, snapshots: list[dict]) -> list[Snapshot]:
+    """
+    Create several snapshots in a single INSERT round-trip.
+
+    Each dict takes the same keyword arguments as create_snapshot(); the
+    created snapshots are returned in input order.
+    """
+    rows = [
+        {
+            "id": snapshot.get("snapshot_id") or str(uuid.uuid4()),
+            "project_id": snapshot["project_id"],
+            "name": snapshot["name"],
+            "description": snapshot.get("description"),
+            "tags": snapshot.get("tags") or [],
+            "run_id": snapshot.get("run_id"),
+            "snapshot_data": snapshot.get("snapshot_data") or {},
+            "reference_metrics": snapshot.get("reference_metrics"),
+            "invariants": snapshot.get("invariants") or [],
+            "version": snapshot.get("version", "1.0"),
+        }
+        for snapshot in snapshots
+    ]
+    if not rows:
+        return []
+
+    created = session.scalars(
+        insert(Snapshot).returning(Snapshot, sort_by_parameter_order=True),
+        rows
+    ).all()
+    session.commit()
+    return list(created)
+
+
 def get_snapshot(session: Session, snapshot_id: str) -> Snapshot | None:
     """Get a snapshot by ID."""
     return session.query(Snapshot).filter(Snapshot.id == snapshot_id).first()
@@ -29,15 +29,28 @@ logger = logging.getLogger(__name__)
 class ProblemSpecService:
     """Service for ProblemSpec operations."""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, agent: Optional[ProblemSpecAgent] = None):
         """
         Initialize ProblemSpec service.
 
         Args:
             session: Database session
+            agent: ProblemSpec agent to use (a new one is created on first
+                use if omitted)
         """
         self.session = session
-        self.agent = ProblemSpecAgent()
+        self._agent = agent
+
+    @property
+    def agent(self) -> ProblemSpecAgent:
+        """ProblemSpec agent, created on first access if none was injected."""
+        if self._agent is None:
+            self._agent = ProblemSpecAgent()
+        return self._agent
+
+    @agent.setter
+    def agent(self, agent: ProblemSpecAgent) -> None:
+        self._agent = agent
 
     def refine_problem_spec(
         self,
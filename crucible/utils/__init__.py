@@ -2,5 +2,5 @@
 Utility helpers shared across Crucible modules.
 """
 
-__all__ = ["llm_usage"]
+__all__ = ["fast_json", "llm_usage"]
 
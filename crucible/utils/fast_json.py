@@ -0,0 +1,42 @@
+"""
+JSON parsing and encoding backed by orjson.
+
+orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+parse failures as they would with the standard library. Unlike json.loads,
+parsing rejects NaN and Infinity.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Optional
+
+import orjson
+
+
+def loads(content: str | bytes) -> Any:
+    """
+    Parse a JSON document.
+
+    Raises:
+        json.JSONDecodeError: If content is not valid JSON
+    """
+    return orjson.loads(content)
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None, indent: bool = False) -> str:
+    """
+    Serialize obj to a JSON string.
+
+    Output is compact, or indented by two spaces when indent is true. Values
+    orjson rejects (e.g. integers wider than 64 bits) are retried with the
+    standard library.
+    """
+    option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+    try:
+        return orjson.dumps(obj, default=default, option=option).decode()
+    except TypeError:
+        pass
+    if indent:
+        return json.dumps(obj, default=default, indent=2, ensure_ascii=False)
+    return json.dumps(obj, default=default, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,40 @@
+"""
+Parsing of JSON answers returned by LLM agents.
+
+Models often wrap their JSON in a markdown code fence (```json ... ```),
+sometimes with prose before or after it. These helpers extract the fenced
+body and parse it with fast_json.
+"""
+
+import re
+from typing import Any
+
+from crucible.utils import fast_json
+
+# Body of the first markdown code fence (```json or bare ```), with
+# surrounding whitespace trimmed. Not anchored, so prose around the fence is
+# tolerated.
+_FENCE_RE = re.compile(r"```(?:json)?\s*(?P<body>.*?)\s*```", re.DOTALL)
+
+
+def strip_code_fence(content: str) -> str:
+    """
+    Return the body of the first markdown code fence in content.
+
+    Content without a fence is returned with surrounding whitespace stripped.
+    """
+    content = content.strip()
+    match = _FENCE_RE.search(content)
+    if match:
+        return match.group("body")
+    return content
+
+
+def parse_llm_json(content: str) -> Any:
+    """
+    Parse an LLM response as JSON, unwrapping a markdown code fence if present.
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    return fast_json.loads(strip_code_fence(content))
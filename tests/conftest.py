@@ -3,41 +3,106 @@ Pytest configuration and fixtures for Int Crucible tests.
 """
 
 import pytest
+from types import MappingProxyType
 from unittest.mock import Mock, MagicMock
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 from typing import Generator
 
 from crucible.db.models import Base as CrucibleBase, Issue  # Import Issue to ensure it's in metadata
 from crucible.db.session import get_session
+from crucible.agents._cache import reset_llm_cache
 from crucible.agents.problemspec_agent import ProblemSpecAgent
 from crucible.agents.worldmodeller_agent import WorldModellerAgent
 from crucible.services.problemspec_service import ProblemSpecService
 from kosmos.core.providers.base import LLMResponse, UsageStats
 
 
-@pytest.fixture
-def test_db_session():
+@pytest.fixture(scope="session")
+def _engine():
     """
-    Create an in-memory SQLite database session for testing.
-    
-    Note: Uses check_same_thread=False to allow cross-thread access
-    for FastAPI TestClient integration tests.
+    In-memory SQLite engine with the schema created once per test session.
+
+    StaticPool keeps the single in-memory database on one connection, and
+    check_same_thread=False allows cross-thread access for FastAPI
+    TestClient integration tests. pysqlite's own transaction handling is
+    switched off so SQLAlchemy can emit BEGIN and SAVEPOINT itself.
     """
     engine = create_engine(
         "sqlite:///:memory:",
         echo=False,
-        connect_args={"check_same_thread": False}
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
     )
+
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     CrucibleBase.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def _connection(_engine):
+    """The one connection every test session is bound to."""
+    with _engine.connect() as conn:
+        yield conn
+
+
+@pytest.fixture(autouse=True)
+def _reset_llm_cache():
+    """Keep responses cached by one test from being served to the next."""
+    yield
+    reset_llm_cache()
+
+
+@pytest.fixture(scope="class")
+def class_db_session(_connection):
+    """
+    Database session for rows shared by every test in a class.
+
+    Its transaction stays open until the class finishes; each test's
+    test_db_session nests inside it, so the tests see these rows but only
+    their own writes are rolled back after each test.
+    """
+    trans = _connection.begin()
+    session = Session(bind=_connection, join_transaction_mode="create_savepoint")
+    
+    try:
+        yield session
+    finally:
+        session.close()
+        trans.rollback()
+
+
+@pytest.fixture
+def test_db_session(_connection):
+    """
+    Database session for one test, rolled back when the test ends.
+
+    The session joins an outer transaction on the shared connection and
+    turns its own commits into SAVEPOINTs, so code under test can commit
+    and roll back freely while nothing outlives the test. Inside a class
+    using class_db_session the outer transaction is itself a SAVEPOINT.
+    """
+    if _connection.in_transaction():
+        trans = _connection.begin_nested()
+    else:
+        trans = _connection.begin()
+    session = Session(bind=_connection, join_transaction_mode="create_savepoint")
     
     try:
         yield session
     finally:
         session.close()
-        engine.dispose()
+        trans.rollback()
 
 
 @pytest.fixture
@@ -61,6 +126,16 @@ def mock_llm_provider():
     return provider
 
 
+@pytest.fixture(scope="session")
+def shared_problemspec_agent():
+    """
+    One real ProblemSpecAgent for the whole run.
+
+    For service tests that never reach the agent; don't mutate it.
+    """
+    return ProblemSpecAgent()
+
+
 @pytest.fixture
 def mock_problemspec_agent(mock_llm_provider):
     """
@@ -71,22 +146,30 @@ def mock_problemspec_agent(mock_llm_provider):
     return agent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_chat_messages():
     """
     Sample chat messages for testing.
+
+    Shared across the session, so returned read-only.
     """
-    return [
-        {"role": "user", "content": "I need to improve API response times."},
-        {"role": "agent", "content": "What specific endpoints are slow?"},
-        {"role": "user", "content": "The user profile endpoint takes 2-3 seconds."},
-    ]
+    return tuple(
+        MappingProxyType(message)
+        for message in (
+            {"role": "user", "content": "I need to improve API response times."},
+            {"role": "agent", "content": "What specific endpoints are slow?"},
+            {"role": "user", "content": "The user profile endpoint takes 2-3 seconds."},
+        )
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_current_spec():
     """
     Sample current ProblemSpec for testing.
+
+    Shared across the session; agents json.dumps it, so it stays a plain
+    dict. Build new dicts instead of mutating it.
     """
     return {
         "constraints": [
@@ -98,10 +181,13 @@ def sample_current_spec():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_llm_response_json():
     """
     Sample LLM response JSON for testing.
+
+    Shared across the session; serialized with fast_json.dumps, so it stays a
+    plain dict. Build new dicts instead of mutating it.
     """
     return {
         "updated_spec": {
@@ -175,10 +261,13 @@ def sample_world_model():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_worldmodel_llm_response():
     """
     Sample LLM response JSON for WorldModeller testing.
+
+    Shared across the session; serialized with fast_json.dumps, so it stays a
+    plain dict. Build new dicts instead of mutating it.
     """
     return {
         "updated_model": {
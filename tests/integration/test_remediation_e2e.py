@@ -17,18 +17,32 @@ from crucible.db.repositories import create_project, create_issue, create_run
 from crucible.db.models import RunMode, IssueResolutionStatus
 
 
+@pytest.fixture(autouse=True)
+def _clear_overrides():
+    """Drop the get_db override after every test, even if the test fails."""
+    from crucible.api.main import get_db
+    
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="class")
+def api_client():
+    """Create a single test client, shared across a test class."""
+    with TestClient(app) as client:
+        yield client
+
+
 @pytest.fixture
-def test_client(integration_db_session):
-    """Create a test client with database override."""
+def test_client(api_client, integration_db_session):
+    """Bind the shared test client to this test's database session."""
     from crucible.api.main import get_db
     
     def override_get_db():
         yield integration_db_session
     
     app.dependency_overrides[get_db] = override_get_db
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
+    return api_client
 
 
 @pytest.fixture
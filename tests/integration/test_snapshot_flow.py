@@ -6,99 +6,236 @@ These tests verify the end-to-end snapshot workflow:
 - Restoring snapshot data
 - Replaying snapshots (with mocked pipeline execution)
 - Invariant validation
+
+Snapshot names get random suffixes rather than timestamps, so these tests
+never collide on the unique name constraint and can be sharded across
+workers (e.g. ``pytest -n auto`` with pytest-xdist).
 """
 
+import copy
+import functools
+import json
 import pytest
+from contextlib import contextmanager
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
+from uuid import uuid4
+
+from sqlalchemy import create_engine, event, insert, text
+from sqlalchemy.orm import Session
 
-from crucible.db.session import get_session
 from crucible.db.repositories import (
     create_project,
-    create_problem_spec,
-    create_world_model,
     create_run,
     create_snapshot,
+    create_snapshots,
     get_snapshot,
     list_snapshots,
     delete_snapshot,
+    update_run_status,
 )
 from crucible.services.snapshot_service import SnapshotService
-from crucible.db.models import ResolutionLevel, RunMode, RunStatus
+from crucible.db.models import (
+    ProblemSpec,
+    Project,
+    ResolutionLevel,
+    RunMode,
+    RunStatus,
+    WorldModel,
+)
 
 
-@pytest.fixture
-def db_session():
-    """Get database session."""
-    from kosmos.db import init_from_config
-    from crucible.db.session import init_from_config as crucible_init_from_config
+# Canonical verification query for restored snapshots: the ProblemSpec
+# constraints and WorldModel data of one project, fetched in one statement
+_RESTORED_ROWS_QUERY = text(
+    "SELECT 'spec' AS kind, constraints AS payload FROM crucible_problem_specs "
+    "WHERE project_id = :project_id "
+    "UNION ALL "
+    "SELECT 'model' AS kind, model_data AS payload FROM crucible_world_models "
+    "WHERE project_id = :project_id"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_migrated(database_url: str) -> None:
+    """
+    Upgrade the database to the Alembic head, at most once per URL.
+    
+    The current revision is compared with the script heads first, so a
+    database that is already at head never loads env.py or replays the
+    migration graph.
+    """
     import alembic.config
     import alembic.command
+    from alembic.runtime.migration import MigrationContext
+    from alembic.script import ScriptDirectory
+    
+    alembic_cfg = alembic.config.Config("alembic.ini")
+    head_revisions = set(ScriptDirectory.from_config(alembic_cfg).get_heads())
+    
+    engine = create_engine(database_url)
+    try:
+        with engine.connect() as connection:
+            current_revisions = set(MigrationContext.configure(connection).get_current_heads())
+    finally:
+        engine.dispose()
+    
+    if current_revisions != head_revisions:
+        alembic.command.upgrade(alembic_cfg, "head")
+
+
+@pytest.fixture(scope="session")
+def _db_engine():
+    """
+    Initialize databases, apply migrations, and yield an engine for this module.
+    
+    The engine is dedicated to these tests, so the pysqlite transaction
+    listeners below never reach the shared kosmos.db engine.
+    """
+    from kosmos.db import init_from_config
+    from crucible.config import get_config
+    from crucible.db.session import init_from_config as crucible_init_from_config
     
     # Initialize databases
     init_from_config()
     crucible_init_from_config()
     
     # Ensure all migrations are applied
-    alembic_cfg = alembic.config.Config("alembic.ini")
-    alembic.command.upgrade(alembic_cfg, "head")
+    database_url = get_config().database_url
+    _ensure_migrated(database_url)
     
-    with get_session() as session:
-        yield session
+    engine = create_engine(database_url)
+    if engine.dialect.name == "sqlite":
+        # pysqlite defers BEGIN until the first DML statement, so releasing the
+        # first SAVEPOINT would commit for real. Emit BEGIN ourselves instead.
+        @event.listens_for(engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+        
+        @event.listens_for(engine, "begin")
+        def _emit_begin(conn):
+            conn.exec_driver_sql("BEGIN")
+    
+    yield engine
+    engine.dispose()
 
 
-@pytest.fixture
-def test_project(db_session):
-    """Create a test project with ProblemSpec and WorldModel."""
-    import uuid
+@contextmanager
+def _rollback_session(engine):
+    """
+    Open a session whose changes are rolled back when the block exits.
     
-    project_id = str(uuid.uuid4())
-    project = create_project(
-        db_session,
-        title="Test Project for Snapshot",
-        description="Temporary project for snapshot testing",
-        project_id=project_id
-    )
+    The session is joined into an outer transaction on a dedicated
+    connection; commits made by repositories and services only release a
+    SAVEPOINT, so nothing persists.
+    """
+    connection = engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint")
     
-    # Create ProblemSpec
-    create_problem_spec(
-        db_session,
-        project_id=project_id,
-        constraints=[
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
+
+
+def _insert_test_project(session):
+    """Insert a project with ProblemSpec and WorldModel and return the Project."""
+    project_id = str(uuid4())
+    
+    # Bulk-insert the three rows and commit once; RETURNING hands back the
+    # Project without the refresh SELECT that create_project() issues
+    project = session.scalars(
+        insert(Project).returning(Project),
+        [{
+            "id": project_id,
+            "title": "Test Project for Snapshot",
+            "description": "Temporary project for snapshot testing",
+        }]
+    ).one()
+    session.execute(insert(ProblemSpec), [{
+        "id": str(uuid4()),
+        "project_id": project_id,
+        "constraints": [
             {"name": "test_constraint", "description": "Test constraint", "weight": 50}
         ],
-        goals=["Test goal"],
-        resolution=ResolutionLevel.MEDIUM.value,
-        mode=RunMode.FULL_SEARCH.value
-    )
-    
-    # Create WorldModel
-    create_world_model(
-        db_session,
-        project_id=project_id,
-        model_data={
+        "goals": ["Test goal"],
+        "resolution": ResolutionLevel.MEDIUM.value,
+        "mode": RunMode.FULL_SEARCH.value,
+    }])
+    session.execute(insert(WorldModel), [{
+        "id": str(uuid4()),
+        "project_id": project_id,
+        "model_data": {
             "actors": [{"id": "actor_1", "name": "Test Actor"}],
             "mechanisms": [],
             "resources": []
-        }
-    )
+        },
+    }])
+    session.commit()
     
     return project
 
 
-class TestSnapshotFlow:
-    """Integration tests for snapshot flow."""
+@pytest.fixture
+def db_session(_db_engine):
+    """Get a database session that is rolled back after the test."""
+    with _rollback_session(_db_engine) as session:
+        yield session
 
-    def test_create_snapshot_from_project(self, db_session, test_project):
-        """Test creating a snapshot from a project."""
-        service = SnapshotService(db_session)
-        
-        # Capture snapshot data
-        snapshot_data = service.capture_snapshot_data(
-            project_id=test_project.id,
+
+@pytest.fixture
+def test_project_full(db_session):
+    """Create a test project with ProblemSpec and WorldModel."""
+    return _insert_test_project(db_session)
+
+
+@pytest.fixture
+def test_project_minimal(db_session):
+    """
+    Create a bare project row, for tests that only need a valid project ID.
+    
+    Snapshot data comes from captured_snapshot_data, so tests that never
+    capture or restore skip the ProblemSpec and WorldModel inserts.
+    """
+    project = Project(id=str(uuid4()), title="Minimal Test Project for Snapshot")
+    db_session.add(project)
+    db_session.flush()
+    return project
+
+
+@pytest.fixture
+def snapshot_service(db_session):
+    """SnapshotService bound to this test's database session."""
+    return SnapshotService(db_session)
+
+
+@pytest.fixture(scope="session")
+def captured_snapshot_data(_db_engine):
+    """
+    Capture snapshot data once per test session.
+    
+    Every test project is built from the same rows, and the captured data
+    carries no project ID, so one capture serves all tests. Tests that
+    mutate it must take a deep copy.
+    """
+    with _rollback_session(_db_engine) as session:
+        project = _insert_test_project(session)
+        return SnapshotService(session).capture_snapshot_data(
+            project_id=project.id,
             include_chat_context=False,
             max_chat_messages=0
         )
+
+
+class TestSnapshotFlow:
+    """Integration tests for snapshot flow."""
+
+    def test_create_snapshot_from_project(self, db_session, test_project_full, captured_snapshot_data):
+        """Test creating a snapshot from a project."""
+        snapshot_data = captured_snapshot_data
         
         assert snapshot_data["version"] == "1.0"
         assert "problem_spec" in snapshot_data
@@ -109,11 +246,10 @@ class TestSnapshotFlow:
         assert snapshot_data["world_model"]["model_data"]["actors"][0]["name"] == "Test Actor"
         
         # Create snapshot record (with unique name)
-        import time
-        unique_name = f"Test Snapshot {int(time.time())}"
+        unique_name = f"Test Snapshot {uuid4().hex[:8]}"
         snapshot = create_snapshot(
             session=db_session,
-            project_id=test_project.id,
+            project_id=test_project_full.id,
             name=unique_name,
             description="Test snapshot for integration test",
             tags=["test", "integration"],
@@ -124,33 +260,25 @@ class TestSnapshotFlow:
         )
         
         assert snapshot.id is not None
-        assert snapshot.name.startswith("Test Snapshot")  # May have timestamp suffix
-        assert snapshot.project_id == test_project.id
+        assert snapshot.name.startswith("Test Snapshot")  # Has a unique suffix
+        assert snapshot.project_id == test_project_full.id
         assert len(snapshot.invariants) == 1
 
-    def test_restore_snapshot_data(self, db_session, test_project):
+    def test_restore_snapshot_data(self, db_session, test_project_full, captured_snapshot_data, snapshot_service):
         """Test restoring snapshot data to a new project."""
-        service = SnapshotService(db_session)
-        
         # Create snapshot
-        snapshot_data = service.capture_snapshot_data(
-            project_id=test_project.id,
-            include_chat_context=False,
-            max_chat_messages=0
-        )
+        snapshot_data = captured_snapshot_data
         
-        import time
-        unique_name = f"Snapshot to Restore {int(time.time())}"
+        unique_name = f"Snapshot to Restore {uuid4().hex[:8]}"
         snapshot = create_snapshot(
             session=db_session,
-            project_id=test_project.id,
+            project_id=test_project_full.id,
             name=unique_name,
             snapshot_data=snapshot_data
         )
         
         # Create new project for restoration
-        import uuid
-        new_project_id = str(uuid.uuid4())
+        new_project_id = str(uuid4())
         new_project = create_project(
             db_session,
             title="Restored Project",
@@ -159,63 +287,49 @@ class TestSnapshotFlow:
         )
         
         # Restore snapshot data
-        service.restore_snapshot_data(new_project_id, snapshot_data)
+        snapshot_service.restore_snapshot_data(new_project_id, snapshot_data)
         
-        # Verify restoration using raw SQL (to avoid schema issues)
-        from sqlalchemy import text
-        spec_result = db_session.execute(
-            text("SELECT constraints FROM crucible_problem_specs WHERE project_id = :project_id"),
-            {"project_id": new_project_id}
-        ).fetchone()
-        
-        model_result = db_session.execute(
-            text("SELECT model_data FROM crucible_world_models WHERE project_id = :project_id"),
-            {"project_id": new_project_id}
-        ).fetchone()
+        # Verify restoration using raw SQL (to avoid schema issues), fetching
+        # both restored rows in a single round-trip
+        rows = {
+            row.kind: row.payload
+            for row in db_session.execute(_RESTORED_ROWS_QUERY, {"project_id": new_project_id})
+        }
         
-        assert spec_result is not None
-        assert model_result is not None
+        assert "spec" in rows
+        assert "model" in rows
         
-        import json
-        constraints = json.loads(spec_result[0]) if isinstance(spec_result[0], str) else spec_result[0]
+        constraints = json.loads(rows["spec"]) if isinstance(rows["spec"], str) else rows["spec"]
         assert len(constraints) == 1
         assert constraints[0]["name"] == "test_constraint"
 
-    def test_snapshot_listing_and_filtering(self, db_session, test_project):
+    def test_snapshot_listing_and_filtering(self, db_session, test_project_full, captured_snapshot_data):
         """Test listing snapshots with filters."""
-        service = SnapshotService(db_session)
-        
         # Create multiple snapshots
-        snapshot_data = service.capture_snapshot_data(
-            project_id=test_project.id,
-            include_chat_context=False,
-            max_chat_messages=0
-        )
-        
-        import time
-        timestamp = int(time.time())
-        snapshot1 = create_snapshot(
-            session=db_session,
-            project_id=test_project.id,
-            name=f"Snapshot 1 {timestamp}",
-            tags=["test", "group1"],
-            snapshot_data=snapshot_data
-        )
-        
-        snapshot2 = create_snapshot(
-            session=db_session,
-            project_id=test_project.id,
-            name=f"Snapshot 2 {timestamp}",
-            tags=["test", "group2"],
-            snapshot_data=snapshot_data
-        )
+        snapshot_data = captured_snapshot_data
+        
+        suffix = uuid4().hex[:8]
+        snapshot1, snapshot2 = create_snapshots(db_session, [
+            {
+                "project_id": test_project_full.id,
+                "name": f"Snapshot 1 {suffix}",
+                "tags": ["test", "group1"],
+                "snapshot_data": snapshot_data,
+            },
+            {
+                "project_id": test_project_full.id,
+                "name": f"Snapshot 2 {suffix}",
+                "tags": ["test", "group2"],
+                "snapshot_data": snapshot_data,
+            },
+        ])
         
         # List all snapshots
         all_snapshots = list_snapshots(db_session)
         assert len(all_snapshots) >= 2
         
         # Filter by project
-        project_snapshots = list_snapshots(db_session, project_id=test_project.id)
+        project_snapshots = list_snapshots(db_session, project_id=test_project_full.id)
         assert len(project_snapshots) >= 2
         
         # Filter by tags (check that our snapshots are in the results)
@@ -224,22 +338,15 @@ class TestSnapshotFlow:
         assert any(s.id == snapshot1.id for s in all_snapshots)
         assert any(s.id == snapshot2.id for s in all_snapshots)
 
-    def test_snapshot_replay_with_mocked_pipeline(self, db_session, test_project):
+    def test_snapshot_replay_with_mocked_pipeline(self, db_session, test_project_full, captured_snapshot_data, snapshot_service):
         """Test snapshot replay with mocked pipeline execution."""
-        service = SnapshotService(db_session)
-        
         # Create snapshot
-        snapshot_data = service.capture_snapshot_data(
-            project_id=test_project.id,
-            include_chat_context=False,
-            max_chat_messages=0
-        )
+        snapshot_data = captured_snapshot_data
         
-        import time
-        unique_name = f"Replay Test Snapshot {int(time.time())}"
+        unique_name = f"Replay Test Snapshot {uuid4().hex[:8]}"
         snapshot = create_snapshot(
             session=db_session,
-            project_id=test_project.id,
+            project_id=test_project_full.id,
             name=unique_name,
             snapshot_data=snapshot_data,
             invariants=[
@@ -248,75 +355,59 @@ class TestSnapshotFlow:
             ]
         )
         
-        # Mock RunService to avoid actual pipeline execution
-        with patch('crucible.services.snapshot_service.RunService') as mock_run_service_class:
-            mock_run_service = Mock()
-            mock_run_service_class.return_value = mock_run_service
-            
-            # Mock pipeline execution
-            mock_run_service.execute_full_pipeline.return_value = {
-                "status": "completed",
-                "candidates": 5
-            }
-            
-            # Mock run creation - need to create actual run in database
-            import uuid
-            from crucible.db.repositories import create_run, update_run_status
-            from crucible.db.models import RunStatus
-            
-            real_run = create_run(
-                db_session,
-                project_id=test_project.id,
-                mode=RunMode.FULL_SEARCH.value,
-                config={"num_candidates": 5, "num_scenarios": 8}
+        # Mock run creation - need to create actual run in database
+        real_run = create_run(
+            db_session,
+            project_id=test_project_full.id,
+            mode=RunMode.FULL_SEARCH.value,
+            config={"num_candidates": 5, "num_scenarios": 8}
+        )
+        
+        # Update run status
+        update_run_status(db_session, real_run.id, RunStatus.COMPLETED.value)
+        
+        # Refresh to get updated counts
+        db_session.refresh(real_run)
+        
+        # Mock the service's RunService to avoid actual pipeline execution
+        snapshot_service.run_service = Mock()
+        snapshot_service.run_service.execute_full_pipeline.return_value = {
+            "status": "completed",
+            "candidates": 5
+        }
+        
+        with patch.multiple(
+            'crucible.services.snapshot_service',
+            get_run_statistics=Mock(return_value={
+                "candidate_count": 5,
+                "scenario_count": 8,
+                "evaluation_count": 40,
+                "top_i_score": 0.75
+            }),
+            # Return our real run from the create_run call in replay_snapshot
+            create_run=Mock(return_value=real_run),
+        ):
+            # Replay snapshot
+            result = snapshot_service.replay_snapshot(
+                snapshot.id,
+                options={"num_candidates": 5, "num_scenarios": 8}
             )
-            
-            # Update run status
-            update_run_status(db_session, real_run.id, RunStatus.COMPLETED.value)
-            
-            # Refresh to get updated counts
-            db_session.refresh(real_run)
-            
-            with patch('crucible.services.snapshot_service.get_run_statistics') as mock_get_stats:
-                
-                # Mock run statistics
-                mock_get_stats.return_value = {
-                    "candidate_count": 5,
-                    "scenario_count": 8,
-                    "evaluation_count": 40,
-                    "top_i_score": 0.75
-                }
-                
-                # Mock the create_run call in replay_snapshot to return our real run
-                with patch('crucible.services.snapshot_service.create_run', return_value=real_run):
-                    # Replay snapshot
-                    result = service.replay_snapshot(
-                        snapshot.id,
-                        options={"num_candidates": 5, "num_scenarios": 8}
-                    )
-                
-                    assert "replay_run_id" in result or "run_id" in result
-                    assert "project_id" in result or "temp_project_id" in result
-                    # Note: validation_results may not be present if pipeline execution failed
-                    # Status can be "passed", "failed", or "completed"
-                    assert result.get("status") in ["passed", "failed", "completed"] or "pipeline_results" in result
-
-    def test_snapshot_deletion(self, db_session, test_project):
-        """Test deleting a snapshot."""
-        service = SnapshotService(db_session)
         
+        assert "replay_run_id" in result or "run_id" in result
+        assert "project_id" in result or "temp_project_id" in result
+        # Note: validation_results may not be present if pipeline execution failed
+        # Status can be "passed", "failed", or "completed"
+        assert result.get("status") in ["passed", "failed", "completed"] or "pipeline_results" in result
+
+    def test_snapshot_deletion(self, db_session, test_project_minimal, captured_snapshot_data):
+        """Test deleting a snapshot."""
         # Create snapshot
-        snapshot_data = service.capture_snapshot_data(
-            project_id=test_project.id,
-            include_chat_context=False,
-            max_chat_messages=0
-        )
+        snapshot_data = captured_snapshot_data
         
-        import time
-        unique_name = f"Snapshot to Delete {int(time.time())}"
+        unique_name = f"Snapshot to Delete {uuid4().hex[:8]}"
         snapshot = create_snapshot(
             session=db_session,
-            project_id=test_project.id,
+            project_id=test_project_minimal.id,
             name=unique_name,
             snapshot_data=snapshot_data
         )
@@ -335,25 +426,18 @@ class TestSnapshotFlow:
         deleted = get_snapshot(db_session, snapshot_id)
         assert deleted is None
 
-    def test_snapshot_data_immutability(self, db_session, test_project):
+    def test_snapshot_data_immutability(self, db_session, test_project_minimal, captured_snapshot_data):
         """Test that snapshot data is immutable after creation."""
-        service = SnapshotService(db_session)
-        
-        # Create snapshot
-        snapshot_data = service.capture_snapshot_data(
-            project_id=test_project.id,
-            include_chat_context=False,
-            max_chat_messages=0
-        )
+        # Create snapshot (from a copy, since this test mutates the dict)
+        snapshot_data = copy.deepcopy(captured_snapshot_data)
         
         original_constraints_count = len(snapshot_data["problem_spec"]["constraints"])
         original_version = snapshot_data["version"]
         
-        import time
-        unique_name = f"Immutable Test Snapshot {int(time.time())}"
+        unique_name = f"Immutable Test Snapshot {uuid4().hex[:8]}"
         snapshot = create_snapshot(
             session=db_session,
-            project_id=test_project.id,
+            project_id=test_project_minimal.id,
             name=unique_name,
             snapshot_data=snapshot_data
         )
@@ -0,0 +1,33 @@
+"""
+Mock helpers shared by unit tests that stub a SQLAlchemy session.
+"""
+
+from unittest.mock import Mock
+
+# One query chain reused by every stub; it is reset on each call, so only
+# the most recent stub is live. filter/order_by return the chain itself so
+# any sequence of refinements ends at the same first()/all().
+_chain = Mock(name="query")
+
+
+def stub_query_chain(session, *, first=None, all=None, side_effect=None):
+    """
+    Make ``session.query(...)`` return a chain ending in the given results.
+
+    Args:
+        session: Mock session to wire up
+        first: Value returned by ``.first()``
+        all: Value returned by ``.all()`` (defaults to an empty list)
+        side_effect: Successive ``.first()`` results, overriding ``first``
+
+    Returns:
+        The query chain mock, for call assertions
+    """
+    _chain.reset_mock(return_value=True, side_effect=True)
+    _chain.filter.return_value = _chain
+    _chain.order_by.return_value = _chain
+    _chain.first.return_value = first
+    _chain.first.side_effect = side_effect
+    _chain.all.return_value = [] if all is None else all
+    session.query.return_value = _chain
+    return _chain
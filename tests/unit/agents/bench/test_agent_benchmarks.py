@@ -0,0 +1,110 @@
+"""
+Benchmarks for the agent execute paths (prompt build, fence strip, JSON parse).
+
+Requires pytest-benchmark; skipped otherwise. pytest.ini deselects the
+benchmark marker, so a plain ``pytest`` run never calibrates these. Run them
+explicitly with ``-m benchmark``; to gate regressions, save a baseline and
+compare against it:
+
+    pytest -m benchmark tests/unit/agents/bench --benchmark-autosave
+    pytest -m benchmark tests/unit/agents/bench --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from crucible.utils import fast_json
+
+
+pytestmark = pytest.mark.benchmark(group="agents")
+
+
+_SCENARIO_RESPONSE = "```json\n" + fast_json.dumps({
+    "scenarios": [
+        {
+            "id": f"scenario_{i}",
+            "name": f"Scenario {i}",
+            "description": "Stress test",
+            "type": "stress_test",
+            "focus": {"constraints": ["constraint_1"]},
+            "initial_state": {},
+            "events": [{"step": 1, "description": "Event", "actor": "actor_1", "action": "act"}],
+            "expected_outcomes": {"success_criteria": ["ok"], "failure_modes": []},
+            "weight": 0.5
+        }
+        for i in range(8)
+    ],
+    "reasoning": "Benchmark payload"
+}) + "\n```"
+
+
+def test_bench_guidance_execute(benchmark, monkeypatch, guidance_agent_cached, llm_mock, make_llm_response):
+    """Benchmark GuidanceAgent.execute on the context-based path."""
+    monkeypatch.setattr(guidance_agent_cached, "llm_provider", llm_mock)
+    llm_mock.generate.return_value = make_llm_response(
+        "Welcome! Start by chatting about your problem to create a ProblemSpec."
+    )
+    task = {
+        "user_query": None,
+        "project_state": {"has_problem_spec": False, "has_world_model": False, "has_runs": False, "run_count": 0},
+        "workflow_stage": "setup",
+        "chat_context": []
+    }
+
+    result = benchmark(guidance_agent_cached.execute, task)
+
+    assert "guidance_message" in result
+
+
+def test_bench_problemspec_execute(benchmark, monkeypatch, problemspec_agent_cached, mock_llm_provider,
+                                   make_llm_response, sample_llm_response_json_str, sample_chat_messages):
+    """Benchmark ProblemSpecAgent.execute with a fenced JSON response."""
+    monkeypatch.setattr(problemspec_agent_cached, "llm_provider", mock_llm_provider)
+    mock_llm_provider.generate.return_value = make_llm_response(
+        "```json\n" + sample_llm_response_json_str + "\n```"
+    )
+    task = {
+        "chat_messages": sample_chat_messages,
+        "current_problem_spec": None,
+        "project_description": "Benchmark project"
+    }
+
+    result = benchmark(problemspec_agent_cached.execute, task)
+
+    assert result["updated_spec"]["resolution"] == "medium"
+
+
+def test_bench_scenario_execute(benchmark, monkeypatch, scenario_agent_cached, mock_llm_provider, make_llm_response):
+    """Benchmark ScenarioGeneratorAgent.execute with a fenced JSON response."""
+    monkeypatch.setattr(scenario_agent_cached, "llm_provider", mock_llm_provider)
+    mock_llm_provider.generate.return_value = make_llm_response(_SCENARIO_RESPONSE)
+    task = {
+        "problem_spec": {"constraints": [{"name": "constraint_1", "description": "Test", "weight": 80}]},
+        "world_model": {"actors": [{"id": "actor_1", "name": "Actor 1"}]},
+        "candidates": [{"id": "candidate_1", "mechanism_description": "Test mechanism"}],
+        "num_scenarios": 8
+    }
+
+    result = benchmark(scenario_agent_cached.execute, task)
+
+    assert len(result["scenarios"]) == 8
+
+
+def test_bench_worldmodeller_execute(benchmark, monkeypatch, worldmodeller_agent_cached, mock_llm_provider,
+                                     make_llm_response, sample_worldmodel_llm_response):
+    """Benchmark WorldModellerAgent.execute with a fenced JSON response."""
+    monkeypatch.setattr(worldmodeller_agent_cached, "llm_provider", mock_llm_provider)
+    mock_llm_provider.generate.return_value = make_llm_response(
+        "Here is the updated model:\n```json\n" + fast_json.dumps(sample_worldmodel_llm_response) + "\n```"
+    )
+    task = {
+        "problem_spec": None,
+        "current_world_model": None,
+        "chat_messages": [],
+        "project_description": "Benchmark project"
+    }
+
+    result = benchmark(worldmodeller_agent_cached.execute, task)
+
+    assert result["updated_model"]["actors"][0]["id"] == "actor_1"
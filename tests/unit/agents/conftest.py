@@ -0,0 +1,277 @@
+"""
+Shared fixtures for agent unit tests.
+"""
+
+import pytest
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Final
+from unittest.mock import create_autospec
+
+from kosmos.core.providers.base import LLMProvider, LLMResponse, UsageStats
+
+from crucible.agents.designer_agent import DesignerAgent
+from crucible.agents.evaluator_agent import EvaluatorAgent
+from crucible.agents.guidance_agent import GuidanceAgent
+from crucible.agents.problemspec_agent import ProblemSpecAgent
+from crucible.agents.scenario_generator_agent import ScenarioGeneratorAgent
+from crucible.agents.worldmodeller_agent import WorldModellerAgent
+from crucible.utils import fast_json
+
+
+@dataclass(frozen=True)
+class AgentJsonCase:
+    """Inputs and expectations for one agent in the shared JSON-parsing tests."""
+
+    agent_cls: type
+    task: Dict[str, Any]
+    ok_response: str
+    markdown_response: str
+    check_ok: Callable[[Dict[str, Any]], None]
+    check_markdown: Callable[[Dict[str, Any]], None]
+    check_parse_error: Callable[[Dict[str, Any]], None]
+
+
+# Canned LLM payloads, serialized once at import time
+_DESIGNER_OK_RESPONSE: Final[str] = fast_json.dumps({
+    "candidates": [
+        {
+            "mechanism_description": "Test mechanism 1",
+            "predicted_effects": {
+                "actors_affected": [{"actor_id": "actor_1", "impact": "positive", "description": "Test"}],
+                "resources_impacted": [],
+                "mechanisms_modified": []
+            },
+            "constraint_compliance": {"constraint_1": 0.8},
+            "reasoning": "Test reasoning 1"
+        },
+        {
+            "mechanism_description": "Test mechanism 2",
+            "predicted_effects": {
+                "actors_affected": [],
+                "resources_impacted": [{"resource_id": "resource_1", "change": "increase", "magnitude": "medium", "description": "Test"}],
+                "mechanisms_modified": []
+            },
+            "constraint_compliance": {"constraint_1": 0.6},
+            "reasoning": "Test reasoning 2"
+        }
+    ],
+    "reasoning": "Overall strategy"
+})
+
+_DESIGNER_MARKDOWN_RESPONSE: Final[str] = "```json\n" + fast_json.dumps({
+    "candidates": [{
+        "mechanism_description": "Test",
+        "predicted_effects": {},
+        "constraint_compliance": {},
+        "reasoning": "Test"
+    }],
+    "reasoning": "Overall"
+}) + "\n```"
+
+_EVAL_OK: Final[str] = fast_json.dumps({
+    "P": {
+        "overall": 0.8,
+        "components": {
+            "prediction_accuracy": 0.85,
+            "scenario_coverage": 0.75
+        }
+    },
+    "R": {
+        "overall": 0.6,
+        "components": {
+            "cost": 0.7,
+            "complexity": 0.5,
+            "resource_usage": 0.6
+        }
+    },
+    "constraint_satisfaction": {
+        "constraint_1": {
+            "satisfied": True,
+            "score": 0.9,
+            "explanation": "Constraint satisfied"
+        }
+    },
+    "explanation": "Candidate performs well in this scenario"
+})
+
+_EVAL_MARKDOWN: Final[str] = "```json\n" + fast_json.dumps({
+    "P": {"overall": 0.7},
+    "R": {"overall": 0.5},
+    "constraint_satisfaction": {},
+    "explanation": "Test"
+}) + "\n```"
+
+
+def _check_designer_ok(result):
+    assert "candidates" in result
+    assert "reasoning" in result
+    assert len(result["candidates"]) == 2
+    assert result["reasoning"] == "Overall strategy"
+    assert result["candidates"][0]["mechanism_description"] == "Test mechanism 1"
+
+
+def _check_designer_markdown(result):
+    assert len(result["candidates"]) == 1
+
+
+def _check_designer_parse_error(result):
+    assert result["candidates"] == []
+    assert "Failed to parse" in result["reasoning"]
+
+
+def _check_evaluator_ok(result):
+    assert "P" in result
+    assert "R" in result
+    assert "constraint_satisfaction" in result
+    assert "explanation" in result
+    assert result["P"]["overall"] == 0.8
+    assert result["R"]["overall"] == 0.6
+
+
+def _check_evaluator_markdown(result):
+    assert result["P"]["overall"] == 0.7
+    assert result["R"]["overall"] == 0.5
+
+
+def _check_evaluator_parse_error(result):
+    # Should return safe defaults
+    assert "P" in result
+    assert "R" in result
+    assert result["P"]["overall"] == 0.5
+    assert result["R"]["overall"] == 0.5
+
+
+_AGENT_JSON_CASES = [
+    AgentJsonCase(
+        agent_cls=DesignerAgent,
+        task={
+            "problem_spec": {
+                "constraints": [{"name": "constraint_1", "description": "Test constraint", "weight": 80}],
+                "goals": ["Goal 1"],
+                "resolution": "medium",
+                "mode": "full_search"
+            },
+            "world_model": {
+                "actors": [{"id": "actor_1", "name": "Actor 1"}],
+                "mechanisms": [],
+                "resources": []
+            },
+            "num_candidates": 2
+        },
+        ok_response=_DESIGNER_OK_RESPONSE,
+        markdown_response=_DESIGNER_MARKDOWN_RESPONSE,
+        check_ok=_check_designer_ok,
+        check_markdown=_check_designer_markdown,
+        check_parse_error=_check_designer_parse_error,
+    ),
+    AgentJsonCase(
+        agent_cls=EvaluatorAgent,
+        task={
+            "candidate": {
+                "id": "candidate_1",
+                "mechanism_description": "Test mechanism",
+                "predicted_effects": {}
+            },
+            "scenario": {
+                "id": "scenario_1",
+                "name": "Test scenario",
+                "description": "Test description",
+                "type": "stress_test"
+            }
+        },
+        ok_response=_EVAL_OK,
+        markdown_response=_EVAL_MARKDOWN,
+        check_ok=_check_evaluator_ok,
+        check_markdown=_check_evaluator_markdown,
+        check_parse_error=_check_evaluator_parse_error,
+    ),
+]
+
+
+@pytest.fixture(params=_AGENT_JSON_CASES, ids=lambda case: case.agent_cls.__name__)
+def agent_case(request):
+    """An agent whose JSON response handling is covered by the shared tests."""
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def default_usage():
+    """Token usage attached to every mocked LLM response."""
+    return UsageStats(input_tokens=100, output_tokens=50, total_tokens=150)
+
+
+@pytest.fixture(scope="session")
+def make_llm_response(default_usage):
+    """Factory wrapping response content in an LLMResponse with default usage."""
+    def _make_llm_response(content: str) -> LLMResponse:
+        return LLMResponse(
+            content=content,
+            usage=default_usage,
+            model="test-model",
+            finish_reason="stop"
+        )
+    return _make_llm_response
+
+
+@pytest.fixture(scope="session")
+def sample_llm_response_json_str(sample_llm_response_json):
+    """sample_llm_response_json serialized once for the session."""
+    return fast_json.dumps(sample_llm_response_json)
+
+
+@pytest.fixture(scope="session")
+def worldmodel_llm_response_obj(make_llm_response, sample_worldmodel_llm_response):
+    """sample_worldmodel_llm_response wrapped in an LLMResponse once for the session."""
+    return make_llm_response(fast_json.dumps(sample_worldmodel_llm_response))
+
+
+@pytest.fixture(scope="session")
+def set_mock_responses(make_llm_response):
+    """Queue one LLMResponse per content string on a provider mock's generate()."""
+    def _set_mock_responses(provider, *contents: str) -> None:
+        provider.generate.side_effect = [make_llm_response(c) for c in contents]
+    return _set_mock_responses
+
+
+@pytest.fixture(scope="session")
+def assert_llm_error_propagates():
+    """Check that agent.execute(task) re-raises an error from its LLM provider."""
+    def _assert_llm_error_propagates(agent, task: Dict[str, Any]) -> None:
+        agent.llm_provider.generate.side_effect = Exception("LLM API error")
+        with pytest.raises(Exception, match="LLM API error"):
+            agent.execute(task)
+    return _assert_llm_error_propagates
+
+
+@pytest.fixture
+def llm_mock():
+    """LLM provider mock specced against LLMProvider; a new one for each test."""
+    return create_autospec(LLMProvider, instance=True)
+
+
+# Agents keep no per-task state, so one instance per session (per xdist
+# worker) is enough; tests swap in their own llm_provider with
+# monkeypatch.setattr so it is restored afterwards.
+# test_agent_initialization tests still construct fresh instances.
+@pytest.fixture(scope="session")
+def guidance_agent_cached():
+    """Session-wide GuidanceAgent instance."""
+    return GuidanceAgent()
+
+
+@pytest.fixture(scope="session")
+def problemspec_agent_cached():
+    """Session-wide ProblemSpecAgent instance."""
+    return ProblemSpecAgent()
+
+
+@pytest.fixture(scope="session")
+def scenario_agent_cached():
+    """Session-wide ScenarioGeneratorAgent instance."""
+    return ScenarioGeneratorAgent()
+
+
+@pytest.fixture(scope="session")
+def worldmodeller_agent_cached():
+    """Session-wide WorldModellerAgent instance."""
+    return WorldModellerAgent()
@@ -0,0 +1,123 @@
+"""
+Unit tests for the agent LLM caching helpers.
+"""
+
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from crucible.agents._cache import LLMCache, generate_cached, get_llm_cache
+from crucible.agents.problemspec_agent import ProblemSpecAgent, _SYSTEM_PROMPT
+
+
+_TASK = {
+    "chat_messages": [],
+    "current_problem_spec": None,
+    "project_description": None
+}
+
+
+@pytest.fixture
+def llm_cache():
+    """The process-wide agent cache; tests/conftest.py resets it after each test."""
+    return get_llm_cache()
+
+
+def test_cache_key_skips_sampled_calls():
+    """Test that only temperature-0 calls get a cache key."""
+    assert LLMCache.cache_key("model", "system", "prompt", 0.3) is None
+    assert LLMCache.cache_key("model", "system", "prompt", 0) is not None
+    assert LLMCache.cache_key("model", "system", "prompt", 0) != LLMCache.cache_key("model", "system", "other", 0)
+
+
+def test_execute_serves_from_cache(llm_cache, mock_llm_provider):
+    """Test that a repeated deterministic call is served without hitting the LLM."""
+    agent = ProblemSpecAgent(config={"temperature": 0, "cache_responses": True})
+    agent.llm_provider = mock_llm_provider
+
+    first = agent.execute(_TASK)
+    second = agent.execute(_TASK)
+
+    assert first == second
+    assert mock_llm_provider.generate.call_count == 1
+
+
+def test_cache_hit_reports_zero_usage(llm_cache, mock_llm_provider):
+    """Test that a cache hit does not report the original call's tokens again."""
+    first = generate_cached(mock_llm_provider, "prompt", "system", 0, 100, use_cache=True)
+    second = generate_cached(mock_llm_provider, "prompt", "system", 0, 100, use_cache=True)
+
+    assert first.usage.total_tokens == 150
+    assert second.content == first.content
+    assert second.usage.total_tokens == 0
+    assert second.usage.input_tokens == second.usage.output_tokens == 0
+    assert second.metadata["cache_hit"] is True
+
+
+def test_execute_without_opt_in_bypasses_cache(llm_cache, mock_llm_provider):
+    """Test that deterministic calls still reach the LLM unless caching is enabled."""
+    agent = ProblemSpecAgent(config={"temperature": 0})
+    agent.llm_provider = mock_llm_provider
+
+    agent.execute(_TASK)
+    agent.execute(_TASK)
+
+    assert mock_llm_provider.generate.call_count == 2
+
+
+def test_execute_sampled_calls_bypass_cache(llm_cache, mock_llm_provider):
+    """Test that sampled calls always reach the LLM, even with caching enabled."""
+    agent = ProblemSpecAgent(config={"cache_responses": True})
+    agent.llm_provider = mock_llm_provider
+
+    agent.execute(_TASK)
+    agent.execute(_TASK)
+
+    assert mock_llm_provider.generate.call_count == 2
+
+
+@pytest.fixture
+def anthropic_client():
+    """Anthropic SDK client mock behind the vendored AnthropicProvider."""
+    pytest.importorskip("anthropic")
+    with patch("kosmos.core.providers.anthropic.Anthropic") as client_cls:
+        client = client_cls.return_value
+        client.messages.create.return_value = SimpleNamespace(
+            content=[SimpleNamespace(text="ok")],
+            usage=SimpleNamespace(input_tokens=10, output_tokens=5),
+            stop_reason="end_turn"
+        )
+        yield client
+
+
+def _anthropic_provider(**config):
+    from kosmos.core.providers.anthropic import AnthropicProvider
+
+    return AnthropicProvider({"api_key": "sk-ant-test", "enable_cache": False, **config})
+
+
+_LONG_SYSTEM_PROMPT = "Static instructions. " * 400
+
+
+def test_anthropic_prompt_caching_off_by_default(anthropic_client):
+    """Test that the provider sends a plain system string unless prompt caching is enabled."""
+    _anthropic_provider().generate("prompt", system=_LONG_SYSTEM_PROMPT)
+
+    assert anthropic_client.messages.create.call_args.kwargs["system"] == _LONG_SYSTEM_PROMPT
+
+
+def test_anthropic_long_system_prompt_marked_for_caching(anthropic_client):
+    """Test that a cacheable-length system prompt is sent as a cache_control block."""
+    _anthropic_provider(enable_prompt_caching=True).generate("prompt", system=_LONG_SYSTEM_PROMPT)
+
+    assert anthropic_client.messages.create.call_args.kwargs["system"] == [
+        {"type": "text", "text": _LONG_SYSTEM_PROMPT, "cache_control": {"type": "ephemeral"}}
+    ]
+
+
+@pytest.mark.parametrize("system", [_SYSTEM_PROMPT, None], ids=["agent_prompt", "no_system"])
+def test_anthropic_short_system_prompt_not_marked(anthropic_client, system):
+    """Test that prompts below the API's cacheable minimum are sent as plain strings."""
+    _anthropic_provider(enable_prompt_caching=True).generate("prompt", system=system)
+
+    assert anthropic_client.messages.create.call_args.kwargs["system"] == (system or "")
@@ -0,0 +1,45 @@
+"""
+Unit tests for LLM JSON response handling shared by DesignerAgent and EvaluatorAgent.
+"""
+
+
+def _make_agent(agent_case, mock_llm_provider):
+    agent = agent_case.agent_cls()
+    agent.llm_provider = mock_llm_provider
+    return agent
+
+
+def test_agent_success(agent_case, mock_llm_provider, make_llm_response):
+    """Test a well-formed JSON response is parsed and returned."""
+    mock_llm_provider.generate.return_value = make_llm_response(agent_case.ok_response)
+    agent = _make_agent(agent_case, mock_llm_provider)
+
+    result = agent.execute(agent_case.task)
+
+    agent_case.check_ok(result)
+    mock_llm_provider.generate.assert_called_once()
+
+
+def test_agent_markdown_block(agent_case, mock_llm_provider, make_llm_response):
+    """Test parsing JSON wrapped in a markdown code block."""
+    mock_llm_provider.generate.return_value = make_llm_response(agent_case.markdown_response)
+    agent = _make_agent(agent_case, mock_llm_provider)
+
+    result = agent.execute(agent_case.task)
+
+    agent_case.check_markdown(result)
+
+
+def test_agent_json_parse_error(agent_case, mock_llm_provider, make_llm_response):
+    """Test invalid JSON falls back to safe defaults."""
+    mock_llm_provider.generate.return_value = make_llm_response("Invalid JSON response")
+    agent = _make_agent(agent_case, mock_llm_provider)
+
+    result = agent.execute(agent_case.task)
+
+    agent_case.check_parse_error(result)
+
+
+def test_agent_propagates_llm_errors(agent_case, mock_llm_provider, assert_llm_error_propagates):
+    """Test that LLM provider errors are re-raised rather than swallowed."""
+    assert_llm_error_propagates(_make_agent(agent_case, mock_llm_provider), agent_case.task)
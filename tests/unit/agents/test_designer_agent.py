@@ -3,12 +3,34 @@ Unit tests for DesignerAgent.
 """
 
 import json
+import re
 import pytest
-from unittest.mock import Mock, MagicMock
+from typing import Final
+from unittest.mock import Mock
 
 from crucible.agents.designer_agent import DesignerAgent
 
 
+# Canned LLM payloads, serialized once at import time
+_DESIGNER_EMPTY_RESPONSE: Final[str] = json.dumps({
+    "candidates": [],
+    "reasoning": "No inputs provided"
+})
+
+_DESIGNER_DEDUP_RESPONSE: Final[str] = json.dumps({
+    "candidates": [{
+        "mechanism_description": "New distinct mechanism",
+        "predicted_effects": {},
+        "constraint_compliance": {},
+        "reasoning": "Different approach"
+    }],
+    "reasoning": "Avoiding duplicates"
+})
+
+
+_EXISTING_RE = re.compile(r"existing", re.IGNORECASE)
+
+
 @pytest.fixture
 def mock_llm_provider():
     """Mock LLM provider."""
@@ -31,113 +53,9 @@ def test_designer_agent_initialization():
     assert agent.llm_provider is not None
 
 
-def test_designer_agent_execute_success(designer_agent, mock_llm_provider):
-    """Test successful candidate generation."""
-    # Mock LLM response
-    mock_response = Mock()
-    mock_response.content = json.dumps({
-        "candidates": [
-            {
-                "mechanism_description": "Test mechanism 1",
-                "predicted_effects": {
-                    "actors_affected": [{"actor_id": "actor_1", "impact": "positive", "description": "Test"}],
-                    "resources_impacted": [],
-                    "mechanisms_modified": []
-                },
-                "constraint_compliance": {"constraint_1": 0.8},
-                "reasoning": "Test reasoning 1"
-            },
-            {
-                "mechanism_description": "Test mechanism 2",
-                "predicted_effects": {
-                    "actors_affected": [],
-                    "resources_impacted": [{"resource_id": "resource_1", "change": "increase", "magnitude": "medium", "description": "Test"}],
-                    "mechanisms_modified": []
-                },
-                "constraint_compliance": {"constraint_1": 0.6},
-                "reasoning": "Test reasoning 2"
-            }
-        ],
-        "reasoning": "Overall strategy"
-    })
-    mock_llm_provider.generate.return_value = mock_response
-
-    # Execute
-    task = {
-        "problem_spec": {
-            "constraints": [{"name": "constraint_1", "description": "Test constraint", "weight": 80}],
-            "goals": ["Goal 1"],
-            "resolution": "medium",
-            "mode": "full_search"
-        },
-        "world_model": {
-            "actors": [{"id": "actor_1", "name": "Actor 1"}],
-            "mechanisms": [],
-            "resources": []
-        },
-        "num_candidates": 2
-    }
-
-    result = designer_agent.execute(task)
-
-    # Verify
-    assert "candidates" in result
-    assert "reasoning" in result
-    assert len(result["candidates"]) == 2
-    assert result["reasoning"] == "Overall strategy"
-    assert result["candidates"][0]["mechanism_description"] == "Test mechanism 1"
-    mock_llm_provider.generate.assert_called_once()
-
-
-def test_designer_agent_execute_with_markdown_code_block(designer_agent, mock_llm_provider):
-    """Test parsing JSON from markdown code block."""
-    mock_response = Mock()
-    mock_response.content = "```json\n" + json.dumps({
-        "candidates": [{
-            "mechanism_description": "Test",
-            "predicted_effects": {},
-            "constraint_compliance": {},
-            "reasoning": "Test"
-        }],
-        "reasoning": "Overall"
-    }) + "\n```"
-    mock_llm_provider.generate.return_value = mock_response
-
-    task = {
-        "problem_spec": {},
-        "world_model": {},
-        "num_candidates": 1
-    }
-
-    result = designer_agent.execute(task)
-    assert len(result["candidates"]) == 1
-
-
-def test_designer_agent_execute_json_parse_error(designer_agent, mock_llm_provider):
-    """Test handling of JSON parse errors."""
-    mock_response = Mock()
-    mock_response.content = "Invalid JSON response"
-    mock_llm_provider.generate.return_value = mock_response
-
-    task = {
-        "problem_spec": {},
-        "world_model": {},
-        "num_candidates": 1
-    }
-
-    result = designer_agent.execute(task)
-    assert result["candidates"] == []
-    assert "Failed to parse" in result["reasoning"]
-
-
-def test_designer_agent_execute_empty_inputs(designer_agent, mock_llm_provider):
+def test_designer_agent_execute_empty_inputs(designer_agent, mock_llm_provider, make_llm_response):
     """Test with empty inputs."""
-    mock_response = Mock()
-    mock_response.content = json.dumps({
-        "candidates": [],
-        "reasoning": "No inputs provided"
-    })
-    mock_llm_provider.generate.return_value = mock_response
+    mock_llm_provider.generate.return_value = make_llm_response(_DESIGNER_EMPTY_RESPONSE)
 
     task = {
         "problem_spec": None,
@@ -149,19 +67,9 @@ def test_designer_agent_execute_empty_inputs(designer_agent, mock_llm_provider):
     assert result["candidates"] == []
 
 
-def test_designer_agent_execute_with_existing_candidates(designer_agent, mock_llm_provider):
+def test_designer_agent_execute_with_existing_candidates(designer_agent, mock_llm_provider, make_llm_response):
     """Test with existing candidates to avoid duplicates."""
-    mock_response = Mock()
-    mock_response.content = json.dumps({
-        "candidates": [{
-            "mechanism_description": "New distinct mechanism",
-            "predicted_effects": {},
-            "constraint_compliance": {},
-            "reasoning": "Different approach"
-        }],
-        "reasoning": "Avoiding duplicates"
-    })
-    mock_llm_provider.generate.return_value = mock_response
+    mock_llm_provider.generate.return_value = make_llm_response(_DESIGNER_DEDUP_RESPONSE)
 
     task = {
         "problem_spec": {},
@@ -174,5 +82,5 @@ def test_designer_agent_execute_with_existing_candidates(designer_agent, mock_ll
     assert len(result["candidates"]) == 1
     # Verify prompt mentions existing candidates
     call_args = mock_llm_provider.generate.call_args
-    assert "existing" in call_args[0][0].lower() or "existing" in str(call_args).lower()
+    assert _EXISTING_RE.search(call_args[0][0]) or _EXISTING_RE.search(str(call_args))
 
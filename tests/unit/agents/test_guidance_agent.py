@@ -2,12 +2,98 @@
 Unit tests for GuidanceAgent.
 """
 
-import json
+import operator
 import pytest
-from unittest.mock import Mock, patch
-from kosmos.core.providers.base import LLMResponse, UsageStats
+from typing import Final
 
 from crucible.agents.guidance_agent import GuidanceAgent
+from crucible.utils import fast_json
+
+
+# Canned LLM payloads, serialized once at import time
+_BASIC_GUIDANCE_JSON: Final[str] = fast_json.dumps({
+    "guidance_message": "Welcome to Int Crucible! Let's get started.",
+    "suggested_actions": [
+        "Start chatting about your problem",
+        "Describe your constraints and goals"
+    ],
+    "explanations": {},
+    "workflow_progress": {
+        "current_stage": "setup",
+        "completed_steps": [],
+        "next_steps": ["Create ProblemSpec via chat"]
+    }
+})
+
+_USER_QUERY_GUIDANCE_JSON: Final[str] = fast_json.dumps({
+    "guidance_message": "A ProblemSpec is a structured problem specification...",
+    "suggested_actions": ["Continue chatting to refine your ProblemSpec"],
+    "explanations": {
+        "ProblemSpec": "A structured problem specification with constraints, goals, and resolution level"
+    },
+    "workflow_progress": {
+        "current_stage": "setup",
+        "completed_steps": [],
+        "next_steps": ["Create ProblemSpec via chat"]
+    }
+})
+
+_ADVANCED_GUIDANCE_JSON: Final[str] = fast_json.dumps({
+    "guidance_message": "Great! You're ready to run.",
+    "suggested_actions": [
+        "Configure and start your first run",
+        "Review the ranked candidates after completion"
+    ],
+    "explanations": {},
+    "workflow_progress": {
+        "current_stage": "ready_to_run",
+        "completed_steps": ["ProblemSpec created", "WorldModel created"],
+        "next_steps": ["Configure and start a run"]
+    }
+})
+
+
+# Task templates; tests override fields with {**_BASE_TASK, ...} rather than mutating these
+_SETUP_STATE = {
+    "has_problem_spec": False,
+    "has_world_model": False,
+    "has_runs": False,
+    "run_count": 0
+}
+
+_BASE_TASK = {
+    "user_query": None,
+    "project_state": _SETUP_STATE,
+    "workflow_stage": "setup",
+    "chat_context": []
+}
+
+
+# Raises KeyError if any expected key is missing from the result
+_GUIDANCE_KEYS = operator.itemgetter("guidance_message", "suggested_actions", "explanations", "workflow_progress")
+
+
+def _check_basic_state(result):
+    _, suggested_actions, _, workflow_progress = _GUIDANCE_KEYS(result)
+    assert isinstance(suggested_actions, list)
+    assert isinstance(workflow_progress, dict)
+
+
+def _check_user_query(result):
+    assert "guidance_message" in result
+    assert "ProblemSpec" in result.get("explanations", {})
+
+
+def _check_advanced_state(result):
+    assert result["workflow_progress"]["current_stage"] == "ready_to_run"
+    assert len(result["workflow_progress"]["completed_steps"]) > 0
+
+
+@pytest.fixture
+def guidance_agent(guidance_agent_cached, llm_mock, monkeypatch):
+    """Shared GuidanceAgent bound to this test's LLM mock."""
+    monkeypatch.setattr(guidance_agent_cached, "llm_provider", llm_mock)
+    return guidance_agent_cached
 
 
 class TestGuidanceAgent:
@@ -21,165 +107,44 @@ class TestGuidanceAgent:
         assert agent.agent_id is not None
         assert hasattr(agent, "llm_provider")
     
-    def test_execute_with_basic_state(self):
-        """Test execute with basic project state."""
-        agent = GuidanceAgent()
-        
-        # Mock LLM response
-        mock_response = {
-            "guidance_message": "Welcome to Int Crucible! Let's get started.",
-            "suggested_actions": [
-                "Start chatting about your problem",
-                "Describe your constraints and goals"
-            ],
-            "explanations": {},
-            "workflow_progress": {
-                "current_stage": "setup",
-                "completed_steps": [],
-                "next_steps": ["Create ProblemSpec via chat"]
-            }
-        }
-        
-        agent.llm_provider = Mock()
-        agent.llm_provider.generate.return_value = LLMResponse(
-            content=json.dumps(mock_response),
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
-        
-        task = {
-            "user_query": None,
-            "project_state": {
-                "has_problem_spec": False,
-                "has_world_model": False,
-                "has_runs": False,
-                "run_count": 0
+    @pytest.mark.parametrize("mock_response,task,check", [
+        pytest.param(
+            _BASIC_GUIDANCE_JSON,
+            _BASE_TASK,
+            _check_basic_state,
+            id="basic_state",
+        ),
+        pytest.param(
+            _USER_QUERY_GUIDANCE_JSON,
+            {**_BASE_TASK, "user_query": "What is a ProblemSpec?"},
+            _check_user_query,
+            id="user_query",
+        ),
+        pytest.param(
+            _ADVANCED_GUIDANCE_JSON,
+            {
+                **_BASE_TASK,
+                "project_state": {**_SETUP_STATE, "has_problem_spec": True, "has_world_model": True},
+                "workflow_stage": "ready_to_run"
             },
-            "workflow_stage": "setup",
-            "chat_context": []
-        }
+            _check_advanced_state,
+            id="advanced_state",
+        ),
+    ])
+    def test_execute(self, guidance_agent, make_llm_response, llm_mock, mock_response, task, check):
+        """Test execute across project states and user queries."""
+        llm_mock.generate.return_value = make_llm_response(mock_response)
         
-        result = agent.execute(task)
+        result = guidance_agent.execute(task)
         
-        assert "guidance_message" in result
-        assert "suggested_actions" in result
-        assert "explanations" in result
-        assert "workflow_progress" in result
-        assert isinstance(result["suggested_actions"], list)
-        assert isinstance(result["workflow_progress"], dict)
+        check(result)
     
-    def test_execute_with_user_query(self):
-        """Test execute with user query."""
-        agent = GuidanceAgent()
-        
-        mock_response = {
-            "guidance_message": "A ProblemSpec is a structured problem specification...",
-            "suggested_actions": ["Continue chatting to refine your ProblemSpec"],
-            "explanations": {
-                "ProblemSpec": "A structured problem specification with constraints, goals, and resolution level"
-            },
-            "workflow_progress": {
-                "current_stage": "setup",
-                "completed_steps": [],
-                "next_steps": ["Create ProblemSpec via chat"]
-            }
-        }
-        
-        agent.llm_provider = Mock()
-        agent.llm_provider.generate.return_value = LLMResponse(
-            content=json.dumps(mock_response),
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
-        
-        task = {
-            "user_query": "What is a ProblemSpec?",
-            "project_state": {
-                "has_problem_spec": False,
-                "has_world_model": False,
-                "has_runs": False,
-                "run_count": 0
-            },
-            "workflow_stage": "setup",
-            "chat_context": []
-        }
-        
-        result = agent.execute(task)
-        
-        assert "guidance_message" in result
-        assert "ProblemSpec" in result.get("explanations", {})
-    
-    def test_execute_with_advanced_state(self):
-        """Test execute with project that has ProblemSpec and WorldModel."""
-        agent = GuidanceAgent()
-        
-        mock_response = {
-            "guidance_message": "Great! You're ready to run.",
-            "suggested_actions": [
-                "Configure and start your first run",
-                "Review the ranked candidates after completion"
-            ],
-            "explanations": {},
-            "workflow_progress": {
-                "current_stage": "ready_to_run",
-                "completed_steps": ["ProblemSpec created", "WorldModel created"],
-                "next_steps": ["Configure and start a run"]
-            }
-        }
-        
-        agent.llm_provider = Mock()
-        agent.llm_provider.generate.return_value = LLMResponse(
-            content=json.dumps(mock_response),
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
-        
-        task = {
-            "user_query": None,
-            "project_state": {
-                "has_problem_spec": True,
-                "has_world_model": True,
-                "has_runs": False,
-                "run_count": 0
-            },
-            "workflow_stage": "ready_to_run",
-            "chat_context": []
-        }
-        
-        result = agent.execute(task)
-        
-        assert result["workflow_progress"]["current_stage"] == "ready_to_run"
-        assert len(result["workflow_progress"]["completed_steps"]) > 0
-    
-    def test_execute_with_invalid_json_fallback(self):
+    def test_execute_with_invalid_json_fallback(self, guidance_agent, set_mock_responses, llm_mock):
         """Test that execute handles invalid JSON gracefully."""
-        agent = GuidanceAgent()
-        
         # Mock LLM response with invalid JSON (plain text)
-        agent.llm_provider = Mock()
-        agent.llm_provider.generate.return_value = LLMResponse(
-            content="This is plain text, not JSON",
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
-        
-        task = {
-            "user_query": None,
-            "project_state": {
-                "has_problem_spec": False,
-                "has_world_model": False,
-                "has_runs": False,
-                "run_count": 0
-            },
-            "workflow_stage": "setup",
-            "chat_context": []
-        }
+        set_mock_responses(llm_mock, "This is plain text, not JSON")
         
-        result = agent.execute(task)
+        result = guidance_agent.execute(_BASE_TASK)
         
         # Should still return valid structure with fallback values
         assert "guidance_message" in result
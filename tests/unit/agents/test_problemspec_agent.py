@@ -2,12 +2,30 @@
 Unit tests for ProblemSpecAgent.
 """
 
-import json
 import pytest
-from unittest.mock import Mock, patch
-from kosmos.core.providers.base import LLMResponse, UsageStats
+from unittest.mock import patch
 
-from crucible.agents.problemspec_agent import ProblemSpecAgent
+from crucible.agents.problemspec_agent import ProblemSpecAgent, _SYSTEM_PROMPT
+
+
+# Markdown code fence delimiters for wrapping JSON payloads
+_FENCE_JSON = "```json\n"
+_FENCE_PLAIN = "```\n"
+_FENCE_END = "\n```"
+
+# Task template; tests override fields with {**_BASE_TASK, ...} rather than mutating it
+_BASE_TASK = {
+    "chat_messages": [],
+    "current_problem_spec": None,
+    "project_description": None
+}
+
+
+@pytest.fixture
+def mock_problemspec_agent(problemspec_agent_cached, mock_llm_provider, monkeypatch):
+    """Shared ProblemSpecAgent bound to this test's mocked LLM provider."""
+    monkeypatch.setattr(problemspec_agent_cached, "llm_provider", mock_llm_provider)
+    return problemspec_agent_cached
 
 
 class TestProblemSpecAgent:
@@ -23,21 +41,10 @@ class TestProblemSpecAgent:
     
     def test_execute_with_empty_chat(self, mock_problemspec_agent, sample_llm_response_json):
         """Test execute with empty chat messages."""
-        # Setup mock response
-        mock_problemspec_agent.llm_provider.generate.return_value = LLMResponse(
-            content=json.dumps(sample_llm_response_json),
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
+        task = _BASE_TASK
         
-        task = {
-            "chat_messages": [],
-            "current_problem_spec": None,
-            "project_description": None
-        }
-        
-        result = mock_problemspec_agent.execute(task)
+        with patch("crucible.agents.problemspec_agent.parse_llm_json", return_value=sample_llm_response_json):
+            result = mock_problemspec_agent.execute(task)
         
         assert "updated_spec" in result
         assert "follow_up_questions" in result
@@ -48,21 +55,14 @@ class TestProblemSpecAgent:
     
     def test_execute_with_chat_messages(self, mock_problemspec_agent, sample_chat_messages, sample_llm_response_json):
         """Test execute with chat messages."""
-        # Setup mock response
-        mock_problemspec_agent.llm_provider.generate.return_value = LLMResponse(
-            content=json.dumps(sample_llm_response_json),
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
-        
         task = {
             "chat_messages": sample_chat_messages,
             "current_problem_spec": None,
             "project_description": "Test project"
         }
         
-        result = mock_problemspec_agent.execute(task)
+        with patch("crucible.agents.problemspec_agent.parse_llm_json", return_value=sample_llm_response_json):
+            result = mock_problemspec_agent.execute(task)
         
         assert result["updated_spec"]["goals"] == ["Reduce response time to under 500ms", "Maintain system reliability"]
         assert len(result["follow_up_questions"]) == 2
@@ -76,48 +76,35 @@ class TestProblemSpecAgent:
     
     def test_execute_with_current_spec(self, mock_problemspec_agent, sample_current_spec, sample_llm_response_json):
         """Test execute with existing ProblemSpec."""
-        # Setup mock response that merges with existing spec
-        response_json = sample_llm_response_json.copy()
-        response_json["updated_spec"]["constraints"].append(sample_current_spec["constraints"][0])
-        
-        mock_problemspec_agent.llm_provider.generate.return_value = LLMResponse(
-            content=json.dumps(response_json),
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
-        
-        task = {
-            "chat_messages": [],
-            "current_problem_spec": sample_current_spec,
-            "project_description": None
+        # Parsed response that merges with existing spec; new outer dicts
+        # wrap the fixture's nested values rather than mutating them
+        updated_spec = sample_llm_response_json["updated_spec"]
+        response_json = {
+            **sample_llm_response_json,
+            "updated_spec": {
+                **updated_spec,
+                "constraints": [*updated_spec["constraints"], sample_current_spec["constraints"][0]]
+            }
         }
         
-        result = mock_problemspec_agent.execute(task)
+        task = {**_BASE_TASK, "current_problem_spec": sample_current_spec}
+        
+        with patch("crucible.agents.problemspec_agent.parse_llm_json", return_value=response_json):
+            result = mock_problemspec_agent.execute(task)
         
         # Should include both existing and new constraints
         constraints = result["updated_spec"]["constraints"]
         assert len(constraints) >= 1
         assert any(c["name"] == "Budget" for c in constraints)
     
-    def test_json_parsing_with_markdown_code_block(self, mock_problemspec_agent, sample_llm_response_json):
+    def test_json_parsing_with_markdown_code_block(self, mock_problemspec_agent, sample_llm_response_json_str, make_llm_response):
         """Test JSON parsing when LLM returns markdown code block."""
         # LLM sometimes wraps JSON in markdown code blocks
-        json_content = json.dumps(sample_llm_response_json)
-        markdown_content = f"```json\n{json_content}\n```"
+        markdown_content = _FENCE_JSON + sample_llm_response_json_str + _FENCE_END
         
-        mock_problemspec_agent.llm_provider.generate.return_value = LLMResponse(
-            content=markdown_content,
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
+        mock_problemspec_agent.llm_provider.generate.return_value = make_llm_response(markdown_content)
         
-        task = {
-            "chat_messages": [],
-            "current_problem_spec": None,
-            "project_description": None
-        }
+        task = _BASE_TASK
         
         result = mock_problemspec_agent.execute(task)
         
@@ -125,44 +112,25 @@ class TestProblemSpecAgent:
         assert "updated_spec" in result
         assert result["updated_spec"]["resolution"] == "medium"
     
-    def test_json_parsing_with_plain_code_block(self, mock_problemspec_agent, sample_llm_response_json):
+    def test_json_parsing_with_plain_code_block(self, mock_problemspec_agent, sample_llm_response_json_str, make_llm_response):
         """Test JSON parsing when LLM returns plain code block."""
-        json_content = json.dumps(sample_llm_response_json)
-        markdown_content = f"```\n{json_content}\n```"
+        markdown_content = _FENCE_PLAIN + sample_llm_response_json_str + _FENCE_END
         
-        mock_problemspec_agent.llm_provider.generate.return_value = LLMResponse(
-            content=markdown_content,
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
+        mock_problemspec_agent.llm_provider.generate.return_value = make_llm_response(markdown_content)
         
-        task = {
-            "chat_messages": [],
-            "current_problem_spec": None,
-            "project_description": None
-        }
+        task = _BASE_TASK
         
         result = mock_problemspec_agent.execute(task)
         
         # Should successfully parse JSON from plain code block
         assert "updated_spec" in result
     
-    def test_json_parsing_invalid_json(self, mock_problemspec_agent):
+    def test_json_parsing_invalid_json(self, mock_problemspec_agent, set_mock_responses):
         """Test error handling when LLM returns invalid JSON."""
         # Invalid JSON response
-        mock_problemspec_agent.llm_provider.generate.return_value = LLMResponse(
-            content="This is not valid JSON at all!",
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
+        set_mock_responses(mock_problemspec_agent.llm_provider, "This is not valid JSON at all!")
         
-        task = {
-            "chat_messages": [],
-            "current_problem_spec": None,
-            "project_description": None
-        }
+        task = _BASE_TASK
         
         result = mock_problemspec_agent.execute(task)
         
@@ -172,23 +140,14 @@ class TestProblemSpecAgent:
         assert result["follow_up_questions"]  # Should have a default question
         assert result["ready_to_run"] is False
     
-    def test_json_parsing_missing_fields(self, mock_problemspec_agent):
+    def test_json_parsing_missing_fields(self, mock_problemspec_agent, set_mock_responses):
         """Test handling when LLM response is missing required fields."""
         # Partial JSON missing some fields
         incomplete_json = '{"updated_spec": {"constraints": []}}'
         
-        mock_problemspec_agent.llm_provider.generate.return_value = LLMResponse(
-            content=incomplete_json,
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
+        set_mock_responses(mock_problemspec_agent.llm_provider, incomplete_json)
         
-        task = {
-            "chat_messages": [],
-            "current_problem_spec": None,
-            "project_description": None
-        }
+        task = _BASE_TASK
         
         result = mock_problemspec_agent.execute(task)
         
@@ -198,7 +157,7 @@ class TestProblemSpecAgent:
         assert isinstance(result["follow_up_questions"], list)  # Default to empty list
         assert "ready_to_run" in result
     
-    def test_prompt_construction(self, mock_problemspec_agent, sample_chat_messages, sample_current_spec):
+    def test_prompt_construction(self, mock_problemspec_agent, sample_chat_messages, sample_current_spec, make_llm_response):
         """Test that prompt is constructed correctly."""
         task = {
             "chat_messages": sample_chat_messages,
@@ -206,39 +165,27 @@ class TestProblemSpecAgent:
             "project_description": "Test project description"
         }
         
-        mock_problemspec_agent.llm_provider.generate.return_value = LLMResponse(
-            content='{"updated_spec": {}, "follow_up_questions": [], "reasoning": "", "ready_to_run": false}',
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
+        mock_problemspec_agent.llm_provider.generate.return_value = make_llm_response('{"updated_spec": {}, "follow_up_questions": [], "reasoning": "", "ready_to_run": false}')
         
         mock_problemspec_agent.execute(task)
         
         # Verify prompt contains expected elements
         call_args = mock_problemspec_agent.llm_provider.generate.call_args
         prompt = call_args[0][0]
+        system = call_args.kwargs["system"]
         
-        assert "ProblemSpec refinement agent" in prompt
+        # Static instructions go in the system prompt, per-call context in the user prompt
+        assert isinstance(system, str)
+        assert system == _SYSTEM_PROMPT
+        assert "ProblemSpec refinement agent" in system
+        assert "ProblemSpec refinement agent" not in prompt
         assert "Test project description" in prompt
         assert "API response times" in prompt  # From chat messages
         assert "Budget" in prompt  # From current spec
     
-    def test_execute_propagates_llm_errors(self, mock_problemspec_agent):
+    def test_execute_propagates_llm_errors(self, mock_problemspec_agent, assert_llm_error_propagates):
         """Test that LLM provider errors are properly propagated."""
-        # Make LLM provider raise an error
-        mock_problemspec_agent.llm_provider.generate.side_effect = Exception("LLM API error")
-        
-        task = {
-            "chat_messages": [],
-            "current_problem_spec": None,
-            "project_description": None
-        }
-        
-        with pytest.raises(Exception) as exc_info:
-            mock_problemspec_agent.execute(task)
-        
-        assert "LLM API error" in str(exc_info.value)
+        assert_llm_error_propagates(mock_problemspec_agent, _BASE_TASK)
     
     def test_ready_to_run_flag(self, mock_problemspec_agent):
         """Test ready_to_run flag handling."""
@@ -250,19 +197,9 @@ class TestProblemSpecAgent:
             "ready_to_run": True
         }
         
-        mock_problemspec_agent.llm_provider.generate.return_value = LLMResponse(
-            content=json.dumps(ready_json),
-            usage=UsageStats(input_tokens=100, output_tokens=50, total_tokens=150),
-            model="test-model",
-            finish_reason="stop"
-        )
+        task = _BASE_TASK
         
-        task = {
-            "chat_messages": [],
-            "current_problem_spec": None,
-            "project_description": None
-        }
-        
-        result = mock_problemspec_agent.execute(task)
+        with patch("crucible.agents.problemspec_agent.parse_llm_json", return_value=ready_json):
+            result = mock_problemspec_agent.execute(task)
         assert result["ready_to_run"] is True
 
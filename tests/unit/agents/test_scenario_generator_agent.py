@@ -2,11 +2,103 @@
 Unit tests for ScenarioGeneratorAgent.
 """
 
-import json
 import pytest
+from typing import Final
 from unittest.mock import Mock
 
 from crucible.agents.scenario_generator_agent import ScenarioGeneratorAgent
+from crucible.utils import fast_json
+
+
+# Canned LLM payloads, serialized once at import time
+_SCENARIO_OK_RESPONSE: Final[str] = fast_json.dumps({
+    "scenarios": [
+        {
+            "id": "scenario_1",
+            "name": "Stress Test 1",
+            "description": "Test scenario description",
+            "type": "stress_test",
+            "focus": {
+                "constraints": ["constraint_1"],
+                "assumptions": ["assumption_1"],
+                "actors": ["actor_1"],
+                "resources": []
+            },
+            "initial_state": {
+                "actors": {"actor_1": {"state": "initial"}},
+                "resources": {},
+                "mechanisms": {}
+            },
+            "events": [
+                {"step": 1, "description": "Event 1", "actor": "actor_1", "action": "action 1"}
+            ],
+            "expected_outcomes": {
+                "success_criteria": ["Criterion 1"],
+                "failure_modes": ["Failure mode 1"]
+            },
+            "weight": 0.9
+        },
+        {
+            "id": "scenario_2",
+            "name": "Edge Case 1",
+            "description": "Edge case scenario",
+            "type": "edge_case",
+            "focus": {
+                "constraints": ["constraint_2"],
+                "assumptions": [],
+                "actors": [],
+                "resources": ["resource_1"]
+            },
+            "initial_state": {
+                "actors": {},
+                "resources": {"resource_1": {"quantity": 0, "units": "units"}},
+                "mechanisms": {}
+            },
+            "events": [],
+            "expected_outcomes": {
+                "success_criteria": ["Criterion 2"],
+                "failure_modes": []
+            },
+            "weight": 0.7
+        }
+    ],
+    "reasoning": "Scenario selection strategy"
+})
+
+_SCENARIO_MARKDOWN_RESPONSE: Final[str] = "```json\n" + fast_json.dumps({
+    "scenarios": [{
+        "id": "scenario_1",
+        "name": "Test",
+        "description": "Test",
+        "type": "stress_test",
+        "focus": {},
+        "initial_state": {},
+        "events": [],
+        "expected_outcomes": {},
+        "weight": 0.5
+    }],
+    "reasoning": "Test"
+}) + "\n```"
+
+_SCENARIO_EMPTY_RESPONSE: Final[str] = fast_json.dumps({
+    "scenarios": [],
+    "reasoning": "No inputs provided"
+})
+
+_SCENARIO_TARGETED_RESPONSE: Final[str] = fast_json.dumps({
+    "scenarios": [{
+        "id": "scenario_1",
+        "name": "Targeted Test",
+        "description": "Tests candidate weaknesses",
+        "type": "stress_test",
+        "focus": {"constraints": ["constraint_1"]},
+        "initial_state": {},
+        "events": [],
+        "expected_outcomes": {},
+        "weight": 0.8
+    }],
+    "reasoning": "Targeting candidate weaknesses"
+})
 
 
 @pytest.fixture
@@ -17,11 +109,10 @@ def mock_llm_provider():
 
 
 @pytest.fixture
-def scenario_agent(mock_llm_provider):
-    """Create ScenarioGeneratorAgent with mocked LLM provider."""
-    agent = ScenarioGeneratorAgent()
-    agent.llm_provider = mock_llm_provider
-    return agent
+def scenario_agent(scenario_agent_cached, mock_llm_provider, monkeypatch):
+    """Shared ScenarioGeneratorAgent bound to this test's mocked LLM provider."""
+    monkeypatch.setattr(scenario_agent_cached, "llm_provider", mock_llm_provider)
+    return scenario_agent_cached
 
 
 def test_scenario_agent_initialization():
@@ -31,64 +122,9 @@ def test_scenario_agent_initialization():
     assert agent.llm_provider is not None
 
 
-def test_scenario_agent_execute_success(scenario_agent, mock_llm_provider):
+def test_scenario_agent_execute_success(scenario_agent, mock_llm_provider, make_llm_response):
     """Test successful scenario generation."""
-    # Mock LLM response
-    mock_response = Mock()
-    mock_response.content = json.dumps({
-        "scenarios": [
-            {
-                "id": "scenario_1",
-                "name": "Stress Test 1",
-                "description": "Test scenario description",
-                "type": "stress_test",
-                "focus": {
-                    "constraints": ["constraint_1"],
-                    "assumptions": ["assumption_1"],
-                    "actors": ["actor_1"],
-                    "resources": []
-                },
-                "initial_state": {
-                    "actors": {"actor_1": {"state": "initial"}},
-                    "resources": {},
-                    "mechanisms": {}
-                },
-                "events": [
-                    {"step": 1, "description": "Event 1", "actor": "actor_1", "action": "action 1"}
-                ],
-                "expected_outcomes": {
-                    "success_criteria": ["Criterion 1"],
-                    "failure_modes": ["Failure mode 1"]
-                },
-                "weight": 0.9
-            },
-            {
-                "id": "scenario_2",
-                "name": "Edge Case 1",
-                "description": "Edge case scenario",
-                "type": "edge_case",
-                "focus": {
-                    "constraints": ["constraint_2"],
-                    "assumptions": [],
-                    "actors": [],
-                    "resources": ["resource_1"]
-                },
-                "initial_state": {
-                    "actors": {},
-                    "resources": {"resource_1": {"quantity": 0, "units": "units"}},
-                    "mechanisms": {}
-                },
-                "events": [],
-                "expected_outcomes": {
-                    "success_criteria": ["Criterion 2"],
-                    "failure_modes": []
-                },
-                "weight": 0.7
-            }
-        ],
-        "reasoning": "Scenario selection strategy"
-    })
-    mock_llm_provider.generate.return_value = mock_response
+    mock_llm_provider.generate.return_value = make_llm_response(_SCENARIO_OK_RESPONSE)
 
     # Execute
     task = {
@@ -123,24 +159,9 @@ def test_scenario_agent_execute_success(scenario_agent, mock_llm_provider):
     mock_llm_provider.generate.assert_called_once()
 
 
-def test_scenario_agent_execute_with_markdown_code_block(scenario_agent, mock_llm_provider):
+def test_scenario_agent_execute_with_markdown_code_block(scenario_agent, mock_llm_provider, make_llm_response):
     """Test parsing JSON from markdown code block."""
-    mock_response = Mock()
-    mock_response.content = "```json\n" + json.dumps({
-        "scenarios": [{
-            "id": "scenario_1",
-            "name": "Test",
-            "description": "Test",
-            "type": "stress_test",
-            "focus": {},
-            "initial_state": {},
-            "events": [],
-            "expected_outcomes": {},
-            "weight": 0.5
-        }],
-        "reasoning": "Test"
-    }) + "\n```"
-    mock_llm_provider.generate.return_value = mock_response
+    mock_llm_provider.generate.return_value = make_llm_response(_SCENARIO_MARKDOWN_RESPONSE)
 
     task = {
         "problem_spec": {},
@@ -153,11 +174,9 @@ def test_scenario_agent_execute_with_markdown_code_block(scenario_agent, mock_ll
     assert len(result["scenarios"]) == 1
 
 
-def test_scenario_agent_execute_json_parse_error(scenario_agent, mock_llm_provider):
+def test_scenario_agent_execute_json_parse_error(scenario_agent, mock_llm_provider, make_llm_response):
     """Test handling of JSON parse errors."""
-    mock_response = Mock()
-    mock_response.content = "Invalid JSON response"
-    mock_llm_provider.generate.return_value = mock_response
+    mock_llm_provider.generate.return_value = make_llm_response("Invalid JSON response")
 
     task = {
         "problem_spec": {},
@@ -171,14 +190,21 @@ def test_scenario_agent_execute_json_parse_error(scenario_agent, mock_llm_provid
     assert "Failed to parse" in result["reasoning"]
 
 
-def test_scenario_agent_execute_empty_inputs(scenario_agent, mock_llm_provider):
+def test_scenario_agent_execute_propagates_llm_errors(scenario_agent, assert_llm_error_propagates):
+    """Test that LLM provider errors are properly propagated."""
+    task = {
+        "problem_spec": None,
+        "world_model": None,
+        "candidates": [],
+        "num_scenarios": 0
+    }
+
+    assert_llm_error_propagates(scenario_agent, task)
+
+
+def test_scenario_agent_execute_empty_inputs(scenario_agent, mock_llm_provider, make_llm_response):
     """Test with empty inputs."""
-    mock_response = Mock()
-    mock_response.content = json.dumps({
-        "scenarios": [],
-        "reasoning": "No inputs provided"
-    })
-    mock_llm_provider.generate.return_value = mock_response
+    mock_llm_provider.generate.return_value = make_llm_response(_SCENARIO_EMPTY_RESPONSE)
 
     task = {
         "problem_spec": None,
@@ -191,24 +217,9 @@ def test_scenario_agent_execute_empty_inputs(scenario_agent, mock_llm_provider):
     assert result["scenarios"] == []
 
 
-def test_scenario_agent_execute_with_candidates(scenario_agent, mock_llm_provider):
+def test_scenario_agent_execute_with_candidates(scenario_agent, mock_llm_provider, make_llm_response):
     """Test with candidates for scenario targeting."""
-    mock_response = Mock()
-    mock_response.content = json.dumps({
-        "scenarios": [{
-            "id": "scenario_1",
-            "name": "Targeted Test",
-            "description": "Tests candidate weaknesses",
-            "type": "stress_test",
-            "focus": {"constraints": ["constraint_1"]},
-            "initial_state": {},
-            "events": [],
-            "expected_outcomes": {},
-            "weight": 0.8
-        }],
-        "reasoning": "Targeting candidate weaknesses"
-    })
-    mock_llm_provider.generate.return_value = mock_response
+    mock_llm_provider.generate.return_value = make_llm_response(_SCENARIO_TARGETED_RESPONSE)
 
     task = {
         "problem_spec": {},
@@ -0,0 +1,21 @@
+"""
+Shared fixtures for unit tests.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+
+@pytest.fixture(autouse=True)
+def _reset_mock_session(request):
+    """
+    Reset a shared ``mock_session`` before each test that uses it.
+
+    Drops calls, return values and side effects left by the previous test.
+    Modules that override ``mock_session`` with a real session are skipped.
+    """
+    if "mock_session" not in request.fixturenames:
+        return
+    session = request.getfixturevalue("mock_session")
+    if isinstance(session, Mock):
+        session.reset_mock(return_value=True, side_effect=True)
@@ -0,0 +1,46 @@
+"""
+Shared fixtures for core unit tests.
+"""
+
+import functools
+import json
+import httpx
+import pytest
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Tuple
+from unittest.mock import Mock
+
+from openai import OpenAI
+
+
+_REPLAY_DIR = Path(__file__).resolve().parents[2] / "fixtures" / "llm_replay"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_replay(name: str) -> Tuple[Dict[str, Any], ...]:
+    """Recorded response bodies for a replay fixture, read from disk once."""
+    with open(_REPLAY_DIR / f"{name}.json") as f:
+        return tuple(json.load(f))
+
+
+@pytest.fixture
+def openai_http_mock(request):
+    """
+    Real OpenAI client with its HTTP transport stubbed out.
+
+    The provider code path runs unchanged down to httpx. ``route`` is called
+    with each outgoing httpx.Request, so tests set its return_value or
+    side_effect to httpx.Response objects and inspect its call_args_list.
+
+    Tests marked ``@pytest.mark.llm_replay(fixture="name")`` get the bodies
+    in tests/fixtures/llm_replay/<name>.json queued in order.
+    """
+    route = Mock(name="POST /v1/chat/completions")
+    marker = request.node.get_closest_marker("llm_replay")
+    if marker is not None:
+        route.side_effect = [httpx.Response(200, json=body) for body in _load_replay(marker.kwargs["fixture"])]
+    http_client = httpx.Client(transport=httpx.MockTransport(route))
+    client = OpenAI(api_key="test-key", http_client=http_client, max_retries=0)
+    yield SimpleNamespace(client=client, route=route)
+    http_client.close()
@@ -9,7 +9,8 @@ from crucible.core.tools import (
     generate_tool_schemas,
     convert_to_anthropic_format,
     convert_to_openai_format,
-    get_json_schema_type
+    get_json_schema_type,
+    _json_schema_type
 )
 
 
@@ -139,4 +140,33 @@ class TestToolSchemaGeneration:
         schema = get_json_schema_type(List[str])
         assert schema["type"] == "array"
         assert "items" in schema
-
+    
+    def test_json_schema_type_is_memoized(self):
+        """Test that repeated lookups are served from the cache."""
+        _json_schema_type.cache_clear()
+        first = get_json_schema_type(List[str])
+        hits = _json_schema_type.cache_info().hits
+        
+        assert get_json_schema_type(List[str]) is first
+        assert _json_schema_type.cache_info().hits == hits + 1
+    
+    def test_generate_tool_schema_does_not_mutate_cached_types(self):
+        """Test that defaults added to a parameter schema don't leak into the type cache."""
+        def tool_with_default(param: str = "default") -> str:
+            return param
+        
+        def tool_with_desc(param: str) -> str:
+            """
+            Tool with a described parameter.
+            
+            :param param: The parameter
+            """
+            return param
+        
+        _json_schema_type.cache_clear()
+        cached = get_json_schema_type(str)
+        generate_tool_schema(tool_with_default)
+        generate_tool_schema(tool_with_desc)
+        
+        assert get_json_schema_type(str) is cached
+        assert cached == {"type": "string"}
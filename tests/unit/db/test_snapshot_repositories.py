@@ -2,38 +2,37 @@
 Unit tests for snapshot repository functions.
 """
 
+import copy
 import pytest
-from unittest.mock import Mock, patch
-from datetime import datetime
+from types import SimpleNamespace
 import uuid
+from unittest.mock import Mock
 
 from crucible.db.repositories import (
+    create_project,
     create_snapshot,
+    create_snapshots,
     get_snapshot,
-    get_snapshot_by_name,
     list_snapshots,
     update_snapshot,
     delete_snapshot,
 )
-from crucible.db.models import Snapshot
+from tests.unit._mock_helpers import stub_query_chain
 
 
-@pytest.fixture
+pytestmark = pytest.mark.xdist_group("snapshot_repositories")
+
+
+@pytest.fixture(scope="module")
 def mock_session():
-    """Mock database session."""
-    session = Mock()
-    session.add = Mock()
-    session.commit = Mock()
-    session.refresh = Mock()
-    session.query = Mock()
-    session.delete = Mock()
-    return session
+    """Mock database session, shared by the module and reset between tests."""
+    return Mock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_snapshot():
-    """Sample Snapshot object."""
-    snapshot = Snapshot(
+    """Sample snapshot row; tests that update it work on a copy."""
+    return SimpleNamespace(
         id="snapshot-123",
         name="Test Snapshot",
         description="Test description",
@@ -45,7 +44,12 @@ def sample_snapshot():
         invariants=[{"type": "min_candidates", "value": 3}],
         version="1.0"
     )
-    return snapshot
+
+
+@pytest.fixture(params=[True, False], ids=["exists", "not_found"])
+def looked_up_snapshot(request, sample_snapshot):
+    """What the stubbed snapshot query finds: the sample snapshot, or nothing."""
+    return sample_snapshot if request.param else None
 
 
 class TestCreateSnapshot:
@@ -65,95 +69,78 @@ class TestCreateSnapshot:
         assert snapshot.id == "snapshot-123"
         assert snapshot.name == "Test Snapshot"
         assert snapshot.project_id == "project-123"
-        mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once()
+        assert mock_session.add.call_count == 1
+        assert mock_session.commit.call_count == 1
+        assert mock_session.refresh.call_count == 1
 
-    def test_create_snapshot_auto_id(self, mock_session):
+    def test_create_snapshot_auto_id(self, mock_session, monkeypatch):
         """Test snapshot creation with auto-generated ID."""
-        with patch('crucible.db.repositories.uuid.uuid4') as mock_uuid:
-            mock_uuid.return_value = Mock()
-            mock_uuid.return_value.__str__ = Mock(return_value="auto-id-123")
-            
-            snapshot = create_snapshot(
-                session=mock_session,
-                project_id="project-123",
-                name="Test Snapshot"
-            )
-            
-            assert snapshot.id == "auto-id-123"
-            mock_session.add.assert_called_once()
+        monkeypatch.setattr(uuid, "uuid4", lambda: "auto-id-123")
+        
+        snapshot = create_snapshot(
+            session=mock_session,
+            project_id="project-123",
+            name="Test Snapshot"
+        )
+        
+        assert snapshot.id == "auto-id-123"
+        assert mock_session.add.call_count == 1
+
+
+class TestCreateSnapshots:
+    """Tests for create_snapshots function."""
+
+    def test_create_snapshots_batch(self, test_db_session):
+        """Test creating several snapshots in one call."""
+        project = create_project(test_db_session, title="Test Project", project_id="project-123")
+        
+        snapshots = create_snapshots(test_db_session, [
+            {"project_id": project.id, "name": "Snapshot 1", "tags": ["group1"], "snapshot_id": "snapshot-1"},
+            {"project_id": project.id, "name": "Snapshot 2", "snapshot_data": {"version": "1.0"}},
+        ])
+        
+        assert [s.name for s in snapshots] == ["Snapshot 1", "Snapshot 2"]
+        assert snapshots[0].id == "snapshot-1"
+        assert snapshots[0].tags == ["group1"]
+        assert snapshots[1].id is not None
+        assert snapshots[1].tags == []
+        assert snapshots[1].snapshot_data == {"version": "1.0"}
+        assert snapshots[1].version == "1.0"
+        assert len(list_snapshots(test_db_session, project_id=project.id)) == 2
+
+    def test_create_snapshots_empty(self, mock_session):
+        """Test creating no snapshots skips the database."""
+        assert create_snapshots(mock_session, []) == []
+        mock_session.commit.assert_not_called()
 
 
 class TestGetSnapshot:
     """Tests for get_snapshot function."""
 
-    def test_get_snapshot_exists(self, mock_session, sample_snapshot):
-        """Test getting existing snapshot."""
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = sample_snapshot
-        mock_session.query.return_value = mock_query
+    def test_get_snapshot(self, mock_session, looked_up_snapshot):
+        """Test getting a snapshot that does or does not exist."""
+        stub_query_chain(mock_session, first=looked_up_snapshot)
         
         result = get_snapshot(mock_session, "snapshot-123")
         
-        assert result == sample_snapshot
-        assert result.id == "snapshot-123"
-
-    def test_get_snapshot_not_found(self, mock_session):
-        """Test getting non-existent snapshot."""
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = None
-        mock_session.query.return_value = mock_query
-        
-        result = get_snapshot(mock_session, "non-existent")
-        
-        assert result is None
+        assert result is looked_up_snapshot
 
 
 class TestListSnapshots:
     """Tests for list_snapshots function."""
 
-    def test_list_snapshots_all(self, mock_session, sample_snapshot):
-        """Test listing all snapshots."""
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.order_by.return_value = mock_query
-        mock_query.all.return_value = [sample_snapshot]
-        mock_session.query.return_value = mock_query
-        
-        result = list_snapshots(mock_session)
-        
-        assert len(result) == 1
-        assert result[0] == sample_snapshot
-
-    def test_list_snapshots_filter_by_project(self, mock_session, sample_snapshot):
-        """Test listing snapshots filtered by project."""
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_filter.order_by.return_value = mock_filter
-        mock_filter.all.return_value = [sample_snapshot]
-        mock_query.filter.return_value = mock_filter
-        mock_session.query.return_value = mock_query
-        
-        result = list_snapshots(mock_session, project_id="project-123")
-        
-        assert len(result) == 1
-        assert result[0].project_id == "project-123"
-
-    def test_list_snapshots_filter_by_tags(self, mock_session, sample_snapshot):
-        """Test listing snapshots filtered by tags."""
-        mock_query = Mock()
-        mock_filter = Mock()
-        mock_filter.order_by.return_value = mock_filter
-        mock_filter.all.return_value = [sample_snapshot]
-        mock_query.filter.return_value = mock_filter
-        mock_session.query.return_value = mock_query
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{}, {"project_id": "project-123"}, {"tags": ["test"]}],
+        ids=["all", "filter_by_project", "filter_by_tags"],
+    )
+    def test_list_snapshots(self, mock_session, sample_snapshot, kwargs):
+        """Test listing snapshots with and without filters."""
+        stub_query_chain(mock_session, all=[sample_snapshot])
         
-        result = list_snapshots(mock_session, tags=["test"])
+        result = list_snapshots(mock_session, **kwargs)
         
-        assert len(result) == 1
+        assert result == [sample_snapshot]
 
 
 class TestUpdateSnapshot:
@@ -161,10 +148,8 @@ class TestUpdateSnapshot:
 
     def test_update_snapshot(self, mock_session, sample_snapshot):
         """Test updating snapshot."""
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = sample_snapshot
-        mock_session.query.return_value = mock_query
+        snapshot = copy.copy(sample_snapshot)
+        stub_query_chain(mock_session, first=snapshot)
         
         result = update_snapshot(
             mock_session,
@@ -174,37 +159,25 @@ class TestUpdateSnapshot:
             invariants=[{"type": "min_candidates", "value": 5}]
         )
         
-        assert result is not None
+        assert result is snapshot
         assert result.description == "Updated description"
         assert result.tags == ["updated", "tags"]
-        mock_session.commit.assert_called_once()
+        assert mock_session.commit.call_count == 1
 
 
 class TestDeleteSnapshot:
     """Tests for delete_snapshot function."""
 
-    def test_delete_snapshot_exists(self, mock_session, sample_snapshot):
-        """Test deleting existing snapshot."""
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = sample_snapshot
-        mock_session.query.return_value = mock_query
+    def test_delete_snapshot(self, mock_session, looked_up_snapshot):
+        """Test deleting a snapshot that does or does not exist."""
+        stub_query_chain(mock_session, first=looked_up_snapshot)
         
         result = delete_snapshot(mock_session, "snapshot-123")
         
-        assert result is True
-        mock_session.delete.assert_called_once_with(sample_snapshot)
-        mock_session.commit.assert_called_once()
-
-    def test_delete_snapshot_not_found(self, mock_session):
-        """Test deleting non-existent snapshot."""
-        mock_query = Mock()
-        mock_query.filter.return_value = mock_query
-        mock_query.first.return_value = None
-        mock_session.query.return_value = mock_query
-        
-        result = delete_snapshot(mock_session, "non-existent")
-        
-        assert result is False
-        mock_session.delete.assert_not_called()
-
+        found = looked_up_snapshot is not None
+        assert result is found
+        if found:
+            mock_session.delete.assert_called_once_with(looked_up_snapshot)
+            assert mock_session.commit.call_count == 1
+        else:
+            mock_session.delete.assert_not_called()
@@ -0,0 +1,65 @@
+"""
+Shared fixtures for service unit tests.
+
+These are built once per test session. ``mock_session`` is reset before
+each test by tests/unit/conftest.py; the sample entities are read-only.
+"""
+
+import pytest
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock
+
+
+@pytest.fixture(scope="session")
+def mock_session():
+    """Mock database session."""
+    return Mock()
+
+
+@pytest.fixture(scope="session")
+def sample_problem_spec():
+    """Sample ProblemSpec."""
+    return SimpleNamespace(
+        constraints=[{"name": "constraint_1", "description": "Test", "weight": 80}],
+        goals=["Goal 1"],
+        resolution=SimpleNamespace(value="medium"),
+        mode=SimpleNamespace(value="full_search"),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_world_model():
+    """Sample WorldModel."""
+    return SimpleNamespace(model_data={
+        "actors": [{"id": "actor_1", "name": "Actor 1"}],
+        "mechanisms": [],
+        "resources": []
+    })
+
+
+@pytest.fixture(scope="session")
+def sample_candidate():
+    """Sample Candidate."""
+    return SimpleNamespace(
+        id="candidate_1",
+        mechanism_description="Test mechanism",
+        predicted_effects={
+            "actors_affected": [{"actor_id": "actor_1", "impact": "positive"}]
+        },
+        scores={},
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_scenario():
+    """Sample scenario; copy with dict(...) before changing it."""
+    return MappingProxyType({
+        "id": "scenario_1",
+        "name": "Test scenario",
+        "description": "Test description",
+        "type": "stress_test",
+        "focus": {"constraints": ["constraint_1"]},
+        "initial_state": {},
+        "events": [],
+        "expected_outcomes": {}
+    })
@@ -3,82 +3,59 @@ Unit tests for DesignerService.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, Mock, patch
 
 from crucible.services.designer_service import DesignerService
-from crucible.db.models import CandidateOrigin, CandidateStatus
 
 
-@pytest.fixture
-def mock_session():
-    """Mock database session."""
-    session = Mock()
-    return session
+pytestmark = pytest.mark.xdist_group("designer_service")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def designer_service(mock_session):
     """Create DesignerService with mocked session."""
-    service = DesignerService(mock_session)
-    service.agent = Mock()
-    return service
+    return DesignerService(mock_session)
 
 
 @pytest.fixture
-def sample_problem_spec():
-    """Sample ProblemSpec."""
-    spec = Mock()
-    spec.constraints = [{"name": "constraint_1", "description": "Test", "weight": 80}]
-    spec.goals = ["Goal 1"]
-    spec.resolution = Mock()
-    spec.resolution.value = "medium"
-    spec.mode = Mock()
-    spec.mode.value = "full_search"
-    return spec
-
+def agent_mock(designer_service, monkeypatch):
+    """Mock agent swapped onto the shared service for one test."""
+    agent = Mock()
+    monkeypatch.setattr(designer_service, "agent", agent)
+    return agent
 
-@pytest.fixture
-def sample_world_model():
-    """Sample WorldModel."""
-    model = Mock()
-    model.model_data = {
-        "actors": [{"id": "actor_1", "name": "Actor 1"}],
-        "mechanisms": [],
-        "resources": []
-    }
-    return model
 
-
-def test_designer_service_initialization(mock_session):
+def test_designer_service_initialization(designer_service, mock_session):
     """Test DesignerService initialization."""
-    service = DesignerService(mock_session)
-    assert service.session == mock_session
-    assert service.agent is not None
-
-
-@patch('crucible.services.designer_service.get_problem_spec')
-@patch('crucible.services.designer_service.get_world_model')
-@patch('crucible.services.designer_service.list_candidates')
-@patch('crucible.services.designer_service.create_candidate')
+    assert designer_service.session is mock_session
+    assert designer_service.agent is not None
+
+
+@patch.multiple(
+    'crucible.services.designer_service',
+    get_problem_spec=DEFAULT,
+    get_world_model=DEFAULT,
+    list_candidates=DEFAULT,
+    create_candidate=DEFAULT,
+    append_candidate_provenance_entry=DEFAULT,
+)
 def test_generate_candidates_success(
-    mock_create_candidate,
-    mock_list_candidates,
-    mock_get_world_model,
-    mock_get_problem_spec,
     designer_service,
+    agent_mock,
     mock_session,
     sample_problem_spec,
-    sample_world_model
+    sample_world_model,
+    **mocks
 ):
     """Test successful candidate generation."""
     # Setup mocks
-    mock_get_problem_spec.return_value = sample_problem_spec
-    mock_get_world_model.return_value = sample_world_model
-    mock_list_candidates.return_value = []
+    mocks["get_problem_spec"].return_value = sample_problem_spec
+    mocks["get_world_model"].return_value = sample_world_model
+    mocks["list_candidates"].return_value = []
 
     # Mock agent response
-    designer_service.agent.execute.return_value = {
+    agent_mock.execute.return_value = {
         "candidates": [
             {
                 "mechanism_description": "Test mechanism 1",
@@ -93,14 +70,14 @@ def test_generate_candidates_success(
     }
 
     # Mock candidate creation
-    mock_candidate = Mock()
-    mock_candidate.id = "candidate_1"
-    mock_candidate.mechanism_description = "Test mechanism 1"
-    mock_candidate.predicted_effects = {}
-    mock_candidate.scores = {}
-    mock_candidate.status = Mock()
-    mock_candidate.status.value = "new"
-    mock_create_candidate.return_value = mock_candidate
+    mock_candidate = SimpleNamespace(
+        id="candidate_1",
+        mechanism_description="Test mechanism 1",
+        predicted_effects={},
+        scores={},
+        status=SimpleNamespace(value="new"),
+    )
+    mocks["create_candidate"].return_value = mock_candidate
 
     # Execute
     result = designer_service.generate_candidates(
@@ -115,30 +92,31 @@ def test_generate_candidates_success(
     assert "count" in result
     assert result["count"] == 1
     assert len(result["candidates"]) == 1
-    mock_create_candidate.assert_called_once()
+    assert mocks["create_candidate"].call_count == 1
+    assert mocks["append_candidate_provenance_entry"].call_count == 1
 
 
-@patch('crucible.services.designer_service.get_problem_spec')
-@patch('crucible.services.designer_service.get_world_model')
-@patch('crucible.services.designer_service.list_candidates')
+@patch.multiple(
+    'crucible.services.designer_service',
+    get_problem_spec=DEFAULT,
+    get_world_model=DEFAULT,
+    list_candidates=DEFAULT,
+)
 def test_generate_candidates_with_existing(
-    mock_list_candidates,
-    mock_get_world_model,
-    mock_get_problem_spec,
     designer_service,
+    agent_mock,
     sample_problem_spec,
-    sample_world_model
+    sample_world_model,
+    **mocks
 ):
     """Test candidate generation with existing candidates."""
-    mock_get_problem_spec.return_value = sample_problem_spec
-    mock_get_world_model.return_value = sample_world_model
+    mocks["get_problem_spec"].return_value = sample_problem_spec
+    mocks["get_world_model"].return_value = sample_world_model
 
     # Mock existing candidates
-    existing_candidate = Mock()
-    existing_candidate.id = "existing_1"
-    mock_list_candidates.return_value = [existing_candidate]
+    mocks["list_candidates"].return_value = [SimpleNamespace(id="existing_1")]
 
-    designer_service.agent.execute.return_value = {
+    agent_mock.execute.return_value = {
         "candidates": [],
         "reasoning": "Avoiding duplicates"
     }
@@ -150,23 +128,28 @@ def test_generate_candidates_with_existing(
     )
 
     # Verify agent was called with existing candidate IDs
-    call_args = designer_service.agent.execute.call_args[0][0]
+    call_args = agent_mock.execute.call_args[0][0]
     assert "existing_1" in call_args["existing_candidates"]
 
 
-@patch('crucible.services.designer_service.get_problem_spec')
-@patch('crucible.services.designer_service.get_world_model')
+@patch.multiple(
+    'crucible.services.designer_service',
+    get_problem_spec=DEFAULT,
+    get_world_model=DEFAULT,
+    list_candidates=DEFAULT,
+)
 def test_generate_candidates_no_problem_spec(
-    mock_get_world_model,
-    mock_get_problem_spec,
     designer_service,
-    sample_world_model
+    agent_mock,
+    sample_world_model,
+    **mocks
 ):
     """Test candidate generation without ProblemSpec."""
-    mock_get_problem_spec.return_value = None
-    mock_get_world_model.return_value = sample_world_model
+    mocks["get_problem_spec"].return_value = None
+    mocks["get_world_model"].return_value = sample_world_model
+    mocks["list_candidates"].return_value = []
 
-    designer_service.agent.execute.return_value = {
+    agent_mock.execute.return_value = {
         "candidates": [],
         "reasoning": "No ProblemSpec"
     }
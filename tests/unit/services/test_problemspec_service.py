@@ -3,8 +3,11 @@ Unit tests for ProblemSpecService.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from types import MappingProxyType
+from unittest.mock import Mock, MagicMock
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
 
 from crucible.services.problemspec_service import ProblemSpecService
 from crucible.db.models import (
@@ -13,9 +16,38 @@ from crucible.db.models import (
 )
 from crucible.db.repositories import (
     create_project, create_chat_session, create_message,
-    create_problem_spec, get_problem_spec
+    get_problem_spec
 )
 
+# Agent result proposing an empty spec; read-only and shared by several tests.
+_EMPTY_AGENT_RESULT = MappingProxyType({
+    "updated_spec": MappingProxyType(
+        {"constraints": [], "goals": [], "resolution": "medium", "mode": "full_search"}
+    ),
+    "follow_up_questions": [],
+    "reasoning": "",
+    "ready_to_run": False
+})
+
+
+@pytest.fixture(scope="class")
+def shared_project(class_db_session):
+    """One Project for every test in a class; tests only add child rows."""
+    return create_project(class_db_session, "Test Project", "Test description")
+
+
+@pytest.fixture
+def project_and_chat(test_db_session, shared_project):
+    """Shared project with a fresh, empty chat session."""
+    chat_session = create_chat_session(test_db_session, shared_project.id, "Test Chat")
+    return shared_project, chat_session
+
+
+@pytest.fixture
+def problemspec_service(test_db_session):
+    """ProblemSpecService with a mock agent; tests set agent.execute behaviour."""
+    return ProblemSpecService(test_db_session, agent=Mock())
+
 
 class TestProblemSpecService:
     """Test suite for ProblemSpecService."""
@@ -28,20 +60,36 @@ class TestProblemSpecService:
         assert hasattr(service, "agent")
         assert service.agent is not None
     
-    def test_get_problem_spec_existing(self, test_db_session):
+    def test_service_uses_injected_agent(self, test_db_session, shared_problemspec_agent):
+        """Test that an agent passed in is used instead of building one."""
+        service = ProblemSpecService(test_db_session, agent=shared_problemspec_agent)
+        
+        assert service.agent is shared_problemspec_agent
+    
+    def test_service_agent_can_be_replaced(self, test_db_session):
+        """Test that agent can still be assigned after construction."""
+        service = ProblemSpecService(test_db_session)
+        replacement = Mock()
+        
+        service.agent = replacement
+        
+        assert service.agent is replacement
+    
+    def test_get_problem_spec_existing(self, test_db_session, shared_problemspec_agent, shared_project):
         """Test retrieving existing ProblemSpec."""
-        # Create project and spec
-        project = create_project(test_db_session, "Test Project", "Test description")
-        create_problem_spec(
-            test_db_session,
-            project.id,
+        # Add a spec to the shared project
+        project = shared_project
+        test_db_session.add(ProblemSpec(
+            id="spec-1",
+            project_id=project.id,
             constraints=[{"name": "Budget", "description": "Limited", "weight": 60}],
             goals=["Goal 1"],
-            resolution="medium",
-            mode="full_search"
-        )
+            resolution=ResolutionLevel.MEDIUM,
+            mode=RunMode.FULL_SEARCH
+        ))
+        test_db_session.flush()
         
-        service = ProblemSpecService(test_db_session)
+        service = ProblemSpecService(test_db_session, agent=shared_problemspec_agent)
         result = service.get_problem_spec(project.id)
         
         assert result is not None
@@ -54,26 +102,24 @@ class TestProblemSpecService:
         assert "provenance_log" in result
         assert result["provenance_log"] == []
     
-    def test_get_problem_spec_nonexistent(self, test_db_session):
+    def test_get_problem_spec_nonexistent(self, test_db_session, shared_problemspec_agent, shared_project):
         """Test retrieving ProblemSpec for project without one."""
-        # Create project without spec
-        project = create_project(test_db_session, "Test Project", "Test description")
+        # The shared project has no spec
+        project = shared_project
         
-        service = ProblemSpecService(test_db_session)
+        service = ProblemSpecService(test_db_session, agent=shared_problemspec_agent)
         result = service.get_problem_spec(project.id)
         
         assert result is None
     
-    @patch('crucible.services.problemspec_service.ProblemSpecAgent')
-    def test_refine_problem_spec_new_spec(self, mock_agent_class, test_db_session):
+    def test_refine_problem_spec_new_spec(self, test_db_session, project_and_chat, problemspec_service):
         """Test refining ProblemSpec when none exists (creates new)."""
         # Setup
-        project = create_project(test_db_session, "Test Project", "Test description")
-        chat_session = create_chat_session(test_db_session, project.id, "Test Chat")
+        project, chat_session = project_and_chat
         create_message(test_db_session, chat_session.id, "user", "I need to improve performance")
         
         # Mock agent
-        mock_agent = Mock()
+        mock_agent = problemspec_service.agent
         mock_agent.execute.return_value = {
             "updated_spec": {
                 "constraints": [{"name": "Performance", "description": "Must be fast", "weight": 80}],
@@ -85,12 +131,8 @@ class TestProblemSpecService:
             "reasoning": "Created initial spec",
             "ready_to_run": False
         }
-        mock_agent_class.return_value = mock_agent
         
-        service = ProblemSpecService(test_db_session)
-        service.agent = mock_agent
-        
-        result = service.refine_problem_spec(project.id, chat_session.id)
+        result = problemspec_service.refine_problem_spec(project.id, chat_session.id)
         
         assert result["updated_spec"] is not None
         assert len(result["follow_up_questions"]) == 1
@@ -104,24 +146,30 @@ class TestProblemSpecService:
         assert len(spec.provenance_log) == 1
         assert spec.provenance_log[0]["type"] == "spec_update"
     
-    @patch('crucible.services.problemspec_service.ProblemSpecAgent')
-    def test_refine_problem_spec_update_existing(self, mock_agent_class, test_db_session):
+    def test_refine_problem_spec_update_existing(self, test_db_session, project_and_chat, problemspec_service):
         """Test refining ProblemSpec when one exists (updates)."""
         # Setup
-        project = create_project(test_db_session, "Test Project", "Test description")
-        create_problem_spec(
-            test_db_session,
-            project.id,
-            constraints=[{"name": "Budget", "description": "Limited", "weight": 60}],
-            goals=["Goal 1"],
-            resolution="medium",
-            mode="full_search"
-        )
-        chat_session = create_chat_session(test_db_session, project.id, "Test Chat")
-        create_message(test_db_session, chat_session.id, "user", "Add performance constraint")
+        project, chat_session = project_and_chat
+        test_db_session.add_all([
+            ProblemSpec(
+                id="spec-1",
+                project_id=project.id,
+                constraints=[{"name": "Budget", "description": "Limited", "weight": 60}],
+                goals=["Goal 1"],
+                resolution=ResolutionLevel.MEDIUM,
+                mode=RunMode.FULL_SEARCH
+            ),
+            Message(
+                id="message-1",
+                chat_session_id=chat_session.id,
+                role=MessageRole.USER,
+                content="Add performance constraint"
+            ),
+        ])
+        test_db_session.flush()
         
         # Mock agent
-        mock_agent = Mock()
+        mock_agent = problemspec_service.agent
         mock_agent.execute.return_value = {
             "updated_spec": {
                 "constraints": [
@@ -136,46 +184,31 @@ class TestProblemSpecService:
             "reasoning": "Added performance constraint",
             "ready_to_run": False
         }
-        mock_agent_class.return_value = mock_agent
-        
-        service = ProblemSpecService(test_db_session)
-        service.agent = mock_agent
         
-        result = service.refine_problem_spec(project.id, chat_session.id)
+        result = problemspec_service.refine_problem_spec(project.id, chat_session.id)
         
         assert result["applied"] is True
         
         # Verify spec was updated in database
         spec = get_problem_spec(test_db_session, project.id)
         assert len(spec.constraints) == 2
-        assert any(c["name"] == "Performance" for c in spec.constraints)
+        assert "Performance" in {c["name"] for c in spec.constraints}
         assert spec.provenance_log is not None
         assert len(spec.provenance_log) >= 1
     
-    @patch('crucible.services.problemspec_service.ProblemSpecAgent')
-    def test_refine_problem_spec_with_chat_messages(self, mock_agent_class, test_db_session):
+    def test_refine_problem_spec_with_chat_messages(self, test_db_session, project_and_chat, problemspec_service):
         """Test that chat messages are passed to agent."""
         # Setup
-        project = create_project(test_db_session, "Test Project", "Test description")
-        chat_session = create_chat_session(test_db_session, project.id, "Test Chat")
+        project, chat_session = project_and_chat
         create_message(test_db_session, chat_session.id, "user", "Message 1")
         create_message(test_db_session, chat_session.id, "agent", "Message 2")
         create_message(test_db_session, chat_session.id, "user", "Message 3")
         
         # Mock agent
-        mock_agent = Mock()
-        mock_agent.execute.return_value = {
-            "updated_spec": {"constraints": [], "goals": [], "resolution": "medium", "mode": "full_search"},
-            "follow_up_questions": [],
-            "reasoning": "",
-            "ready_to_run": False
-        }
-        mock_agent_class.return_value = mock_agent
-        
-        service = ProblemSpecService(test_db_session)
-        service.agent = mock_agent
+        mock_agent = problemspec_service.agent
+        mock_agent.execute.return_value = _EMPTY_AGENT_RESULT
         
-        service.refine_problem_spec(project.id, chat_session.id, message_limit=20)
+        problemspec_service.refine_problem_spec(project.id, chat_session.id, message_limit=20)
         
         # Verify agent was called with chat messages
         call_args = mock_agent.execute.call_args
@@ -185,31 +218,29 @@ class TestProblemSpecService:
         assert len(task["chat_messages"]) == 3
         assert task["chat_messages"][0]["content"] == "Message 1"
     
-    @patch('crucible.services.problemspec_service.ProblemSpecAgent')
-    def test_refine_problem_spec_message_limit(self, mock_agent_class, test_db_session):
+    def test_refine_problem_spec_message_limit(self, test_db_session, project_and_chat, problemspec_service):
         """Test that message_limit limits chat messages passed to agent."""
         # Setup
-        project = create_project(test_db_session, "Test Project", "Test description")
-        chat_session = create_chat_session(test_db_session, project.id, "Test Chat")
-        
-        # Create 10 messages
-        for i in range(10):
-            create_message(test_db_session, chat_session.id, "user", f"Message {i}")
+        project, chat_session = project_and_chat
+        
+        # Create 10 messages in one INSERT, a second apart so their order is fixed
+        start = datetime(2024, 1, 1)
+        test_db_session.execute(insert(Message), [
+            {
+                "id": f"message-{i}",
+                "chat_session_id": chat_session.id,
+                "role": MessageRole.USER,
+                "content": f"Message {i}",
+                "created_at": start + timedelta(seconds=i),
+            }
+            for i in range(10)
+        ])
         
         # Mock agent
-        mock_agent = Mock()
-        mock_agent.execute.return_value = {
-            "updated_spec": {"constraints": [], "goals": [], "resolution": "medium", "mode": "full_search"},
-            "follow_up_questions": [],
-            "reasoning": "",
-            "ready_to_run": False
-        }
-        mock_agent_class.return_value = mock_agent
+        mock_agent = problemspec_service.agent
+        mock_agent.execute.return_value = _EMPTY_AGENT_RESULT
         
-        service = ProblemSpecService(test_db_session)
-        service.agent = mock_agent
-        
-        service.refine_problem_spec(project.id, chat_session.id, message_limit=5)
+        problemspec_service.refine_problem_spec(project.id, chat_session.id, message_limit=5)
         
         # Verify only 5 messages were passed (should be last 5)
         call_args = mock_agent.execute.call_args
@@ -217,42 +248,29 @@ class TestProblemSpecService:
         assert len(task["chat_messages"]) == 5
         assert task["chat_messages"][-1]["content"] == "Message 9"  # Most recent
     
-    @patch('crucible.services.problemspec_service.ProblemSpecAgent')
-    def test_refine_problem_spec_with_project_description(self, mock_agent_class, test_db_session):
+    def test_refine_problem_spec_with_project_description(self, project_and_chat, problemspec_service):
         """Test that project description is passed to agent."""
         # Setup
-        project = create_project(test_db_session, "Test Project", "Test project description")
-        chat_session = create_chat_session(test_db_session, project.id, "Test Chat")
+        project, chat_session = project_and_chat
         
         # Mock agent
-        mock_agent = Mock()
-        mock_agent.execute.return_value = {
-            "updated_spec": {"constraints": [], "goals": [], "resolution": "medium", "mode": "full_search"},
-            "follow_up_questions": [],
-            "reasoning": "",
-            "ready_to_run": False
-        }
-        mock_agent_class.return_value = mock_agent
-        
-        service = ProblemSpecService(test_db_session)
-        service.agent = mock_agent
+        mock_agent = problemspec_service.agent
+        mock_agent.execute.return_value = _EMPTY_AGENT_RESULT
         
-        service.refine_problem_spec(project.id, chat_session.id)
+        problemspec_service.refine_problem_spec(project.id, chat_session.id)
         
         # Verify project description was passed
         call_args = mock_agent.execute.call_args
         task = call_args[0][0]
-        assert task["project_description"] == "Test project description"
+        assert task["project_description"] == "Test description"
     
-    @patch('crucible.services.problemspec_service.ProblemSpecAgent')
-    def test_refine_problem_spec_invalid_enum_values(self, mock_agent_class, test_db_session):
+    def test_refine_problem_spec_invalid_enum_values(self, test_db_session, project_and_chat, problemspec_service):
         """Test handling of invalid enum values from agent."""
         # Setup
-        project = create_project(test_db_session, "Test Project", "Test description")
-        chat_session = create_chat_session(test_db_session, project.id, "Test Chat")
+        project, chat_session = project_and_chat
         
         # Mock agent returning invalid enum values
-        mock_agent = Mock()
+        mock_agent = problemspec_service.agent
         mock_agent.execute.return_value = {
             "updated_spec": {
                 "constraints": [],
@@ -264,12 +282,8 @@ class TestProblemSpecService:
             "reasoning": "",
             "ready_to_run": False
         }
-        mock_agent_class.return_value = mock_agent
         
-        service = ProblemSpecService(test_db_session)
-        service.agent = mock_agent
-        
-        result = service.refine_problem_spec(project.id, chat_session.id)
+        result = problemspec_service.refine_problem_spec(project.id, chat_session.id)
         
         # Should handle invalid enums gracefully (warnings logged, defaults used)
         assert result["applied"] is True
@@ -277,29 +291,27 @@ class TestProblemSpecService:
         spec = get_problem_spec(test_db_session, project.id)
         assert spec is not None
     
-    @patch('crucible.services.problemspec_service.ProblemSpecAgent')
-    def test_refine_problem_spec_agent_error(self, mock_agent_class, test_db_session):
+    def test_refine_problem_spec_agent_error(self, project_and_chat, problemspec_service):
         """Test error handling when agent raises exception."""
         # Setup
-        project = create_project(test_db_session, "Test Project", "Test description")
-        chat_session = create_chat_session(test_db_session, project.id, "Test Chat")
+        project, chat_session = project_and_chat
         
         # Mock agent to raise error
-        mock_agent = Mock()
+        mock_agent = problemspec_service.agent
         mock_agent.execute.side_effect = Exception("Agent error")
-        mock_agent_class.return_value = mock_agent
-        
-        service = ProblemSpecService(test_db_session)
-        service.agent = mock_agent
         
         with pytest.raises(Exception) as exc_info:
-            service.refine_problem_spec(project.id, chat_session.id)
+            problemspec_service.refine_problem_spec(project.id, chat_session.id)
         
         assert "Agent error" in str(exc_info.value)
+
+
+class TestProblemSpecServiceApplyUpdates:
+    """Tests for _apply_spec_updates, which never touches the agent."""
     
-    def test_apply_spec_updates_creates_new(self, test_db_session):
+    def test_apply_spec_updates_creates_new(self, test_db_session, shared_project):
         """Test that _apply_spec_updates creates new spec when none exists."""
-        project = create_project(test_db_session, "Test Project", "Test description")
+        project = shared_project
         
         updated_spec = {
             "constraints": [{"name": "Test", "description": "Test", "weight": 50}],
@@ -312,23 +324,25 @@ class TestProblemSpecService:
         result = service._apply_spec_updates(project.id, None, updated_spec)
         
         assert result is True
+        assert service._agent is None  # Applying updates never builds the agent
         
         # Verify spec was created
         spec = get_problem_spec(test_db_session, project.id)
         assert spec is not None
         assert len(spec.constraints) == 1
     
-    def test_apply_spec_updates_updates_existing(self, test_db_session):
+    def test_apply_spec_updates_updates_existing(self, test_db_session, shared_project):
         """Test that _apply_spec_updates updates existing spec."""
-        project = create_project(test_db_session, "Test Project", "Test description")
-        create_problem_spec(
-            test_db_session,
-            project.id,
+        project = shared_project
+        test_db_session.add(ProblemSpec(
+            id="spec-1",
+            project_id=project.id,
             constraints=[{"name": "Old", "description": "Old", "weight": 50}],
             goals=["Old goal"],
-            resolution="coarse",
-            mode="eval_only"
-        )
+            resolution=ResolutionLevel.COARSE,
+            mode=RunMode.EVAL_ONLY
+        ))
+        test_db_session.flush()
         
         current_spec = get_problem_spec(test_db_session, project.id)
         
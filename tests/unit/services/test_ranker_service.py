@@ -3,73 +3,93 @@ Unit tests for RankerService.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, patch
 
 from crucible.services.ranker_service import RankerService
 from crucible.db.models import CandidateStatus
 
 
-@pytest.fixture
-def mock_session():
-    """Mock database session."""
-    session = Mock()
-    session.commit = Mock()
-    return session
+pytestmark = pytest.mark.xdist_group("ranker_service")
 
+_RUN = SimpleNamespace(id="run_1", project_id="project_1")
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def ranker_service(mock_session):
     """Create RankerService with mocked session."""
-    service = RankerService(mock_session)
-    return service
+    return RankerService(mock_session)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def repo_mocks():
+    """Repository functions RankerService calls, patched once for the module."""
+    patcher = patch.multiple(
+        'crucible.services.ranker_service',
+        get_run=DEFAULT,
+        get_problem_spec=DEFAULT,
+        list_candidates=DEFAULT,
+        list_evaluations=DEFAULT,
+        update_candidate=DEFAULT,
+        append_candidate_provenance_entry=DEFAULT,
+    )
+    mocks = patcher.start()
+    yield mocks
+    patcher.stop()
+
 
+@pytest.fixture(autouse=True)
+def _reset_repo_mocks(repo_mocks):
+    """Drop calls, return values and side effects left by the previous test."""
+    for mock in repo_mocks.values():
+        mock.reset_mock(return_value=True, side_effect=True)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def sample_problem_spec():
-    """Sample ProblemSpec."""
-    spec = Mock()
-    spec.constraints = [
-        {"name": "constraint_1", "description": "Test", "weight": 80},
-        {"name": "constraint_2", "description": "Hard constraint", "weight": 100}
-    ]
-    spec.goals = ["Goal 1"]
-    return spec
+    """Sample ProblemSpec with one soft and one hard (weight 100) constraint."""
+    return SimpleNamespace(
+        constraints=[
+            {"name": "constraint_1", "description": "Test", "weight": 80},
+            {"name": "constraint_2", "description": "Hard constraint", "weight": 100}
+        ],
+        goals=["Goal 1"],
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_candidate():
     """Sample Candidate."""
-    candidate = Mock()
-    candidate.id = "candidate_1"
-    candidate.mechanism_description = "Test mechanism"
-    candidate.scores = None
-    candidate.status = CandidateStatus.NEW
-    candidate.provenance_log = []  # Initialize as empty list
-    return candidate
+    return SimpleNamespace(
+        id="candidate_1",
+        mechanism_description="Test mechanism",
+        scores=None,
+        status=CandidateStatus.NEW,
+        provenance_log=[],
+    )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_evaluation():
     """Sample Evaluation."""
-    evaluation = Mock()
-    evaluation.candidate_id = "candidate_1"
-    evaluation.scenario_id = "scenario_1"
-    evaluation.P = {"overall": 0.8}
-    evaluation.R = {"overall": 0.6}
-    evaluation.constraint_satisfaction = {
-        "constraint_1": {
-            "satisfied": True,
-            "score": 0.9,
-            "explanation": "Satisfied"
+    return SimpleNamespace(
+        candidate_id="candidate_1",
+        scenario_id="scenario_1",
+        P={"overall": 0.8},
+        R={"overall": 0.6},
+        constraint_satisfaction={
+            "constraint_1": {
+                "satisfied": True,
+                "score": 0.9,
+                "explanation": "Satisfied"
+            },
+            "constraint_2": {
+                "satisfied": True,
+                "score": 0.8,
+                "explanation": "Satisfied"
+            }
         },
-        "constraint_2": {
-            "satisfied": True,
-            "score": 0.8,
-            "explanation": "Satisfied"
-        }
-    }
-    return evaluation
+    )
 
 
 def test_ranker_service_initialization(ranker_service):
@@ -77,34 +97,20 @@ def test_ranker_service_initialization(ranker_service):
     assert ranker_service.session is not None
 
 
-@patch('crucible.services.ranker_service.get_run')
-@patch('crucible.services.ranker_service.get_problem_spec')
-@patch('crucible.services.ranker_service.list_candidates')
-@patch('crucible.services.ranker_service.list_evaluations')
-@patch('crucible.services.ranker_service.update_candidate')
-@patch('crucible.services.ranker_service.append_candidate_provenance_entry')
 def test_rank_candidates_success(
-    mock_append_provenance,
-    mock_update_candidate,
-    mock_list_evaluations,
-    mock_list_candidates,
-    mock_get_problem_spec,
-    mock_get_run,
     ranker_service,
     sample_candidate,
     sample_evaluation,
-    sample_problem_spec
+    sample_problem_spec,
+    repo_mocks
 ):
     """Test successful candidate ranking."""
     # Setup mocks
-    mock_run = Mock()
-    mock_run.id = "run_1"
-    mock_run.project_id = "project_1"
-    mock_get_run.return_value = mock_run
+    repo_mocks["get_run"].return_value = _RUN
 
-    mock_get_problem_spec.return_value = sample_problem_spec
-    mock_list_candidates.return_value = [sample_candidate]
-    mock_list_evaluations.return_value = [sample_evaluation]
+    repo_mocks["get_problem_spec"].return_value = sample_problem_spec
+    repo_mocks["list_candidates"].return_value = [sample_candidate]
+    repo_mocks["list_evaluations"].return_value = [sample_evaluation]
 
     result = ranker_service.rank_candidates(
         run_id="run_1",
@@ -118,113 +124,73 @@ def test_rank_candidates_success(
     assert len(result["hard_constraint_violations"]) == 0  # No violations
 
     # Verify candidate was updated
-    assert mock_update_candidate.call_count >= 1
-
-
-@patch('crucible.services.ranker_service.get_run')
-def test_rank_candidates_missing_run(
-    mock_get_run,
-    ranker_service
-):
-    """Test ranking with missing run."""
-    mock_get_run.return_value = None
-
-    with pytest.raises(ValueError, match="Run not found"):
-        ranker_service.rank_candidates(
-            run_id="run_1",
-            project_id="project_1"
-        )
-
-
-@patch('crucible.services.ranker_service.get_run')
-@patch('crucible.services.ranker_service.get_problem_spec')
-def test_rank_candidates_missing_problem_spec(
-    mock_get_problem_spec,
-    mock_get_run,
-    ranker_service
-):
-    """Test ranking with missing ProblemSpec."""
-    mock_run = Mock()
-    mock_run.id = "run_1"
-    mock_run.project_id = "project_1"
-    mock_get_run.return_value = mock_run
-
-    mock_get_problem_spec.return_value = None
-
-    with pytest.raises(ValueError, match="ProblemSpec not found"):
-        ranker_service.rank_candidates(
-            run_id="run_1",
-            project_id="project_1"
-        )
-
-
-@patch('crucible.services.ranker_service.get_run')
-@patch('crucible.services.ranker_service.get_problem_spec')
-@patch('crucible.services.ranker_service.list_candidates')
-def test_rank_candidates_no_candidates(
-    mock_list_candidates,
-    mock_get_problem_spec,
-    mock_get_run,
+    assert repo_mocks["update_candidate"].call_count >= 1
+    assert repo_mocks["append_candidate_provenance_entry"].call_count == 1
+
+
+@pytest.mark.parametrize(
+    "missing,match",
+    [
+        ("get_run", "Run not found"),
+        ("get_problem_spec", "ProblemSpec not found"),
+        ("list_candidates", "No candidates found"),
+        ("list_evaluations", "No evaluations found"),
+    ],
+    ids=["missing_run", "missing_problem_spec", "no_candidates", "no_evaluations"],
+)
+def test_rank_candidates_missing_data(
     ranker_service,
-    sample_problem_spec
+    sample_candidate,
+    sample_evaluation,
+    sample_problem_spec,
+    repo_mocks,
+    missing,
+    match
 ):
-    """Test ranking with no candidates."""
-    mock_run = Mock()
-    mock_run.id = "run_1"
-    mock_run.project_id = "project_1"
-    mock_get_run.return_value = mock_run
-
-    mock_get_problem_spec.return_value = sample_problem_spec
-    mock_list_candidates.return_value = []
-
-    with pytest.raises(ValueError, match="No candidates found"):
+    """Test ranking fails when a lookup it depends on comes back empty."""
+    repo_mocks["get_run"].return_value = _RUN
+    repo_mocks["get_problem_spec"].return_value = sample_problem_spec
+    repo_mocks["list_candidates"].return_value = [sample_candidate]
+    repo_mocks["list_evaluations"].return_value = [sample_evaluation]
+    repo_mocks[missing].return_value = [] if missing.startswith("list_") else None
+
+    with pytest.raises(ValueError, match=match):
         ranker_service.rank_candidates(
             run_id="run_1",
             project_id="project_1"
         )
 
+    assert repo_mocks["update_candidate"].call_count == 0
+
 
-@patch('crucible.services.ranker_service.get_run')
-@patch('crucible.services.ranker_service.get_problem_spec')
-@patch('crucible.services.ranker_service.list_candidates')
-@patch('crucible.services.ranker_service.list_evaluations')
-@patch('crucible.services.ranker_service.update_candidate')
-@patch('crucible.services.ranker_service.append_candidate_provenance_entry')
 def test_rank_candidates_hard_constraint_violation(
-    mock_append_provenance,
-    mock_update_candidate,
-    mock_list_evaluations,
-    mock_list_candidates,
-    mock_get_problem_spec,
-    mock_get_run,
     ranker_service,
     sample_candidate,
-    sample_problem_spec
+    sample_problem_spec,
+    repo_mocks
 ):
     """Test ranking with hard constraint violation."""
     # Setup mocks
-    mock_run = Mock()
-    mock_run.id = "run_1"
-    mock_run.project_id = "project_1"
-    mock_get_run.return_value = mock_run
+    repo_mocks["get_run"].return_value = _RUN
 
-    mock_get_problem_spec.return_value = sample_problem_spec
-    mock_list_candidates.return_value = [sample_candidate]
+    repo_mocks["get_problem_spec"].return_value = sample_problem_spec
+    repo_mocks["list_candidates"].return_value = [sample_candidate]
 
     # Create evaluation with hard constraint violation
-    mock_evaluation = Mock()
-    mock_evaluation.candidate_id = "candidate_1"
-    mock_evaluation.scenario_id = "scenario_1"
-    mock_evaluation.P = {"overall": 0.8}
-    mock_evaluation.R = {"overall": 0.6}
-    mock_evaluation.constraint_satisfaction = {
-        "constraint_2": {  # Hard constraint (weight 100)
-            "satisfied": False,  # Violated!
-            "score": 0.2,
-            "explanation": "Violated"
-        }
-    }
-    mock_list_evaluations.return_value = [mock_evaluation]
+    mock_evaluation = SimpleNamespace(
+        candidate_id="candidate_1",
+        scenario_id="scenario_1",
+        P={"overall": 0.8},
+        R={"overall": 0.6},
+        constraint_satisfaction={
+            "constraint_2": {  # Hard constraint (weight 100)
+                "satisfied": False,  # Violated!
+                "score": 0.2,
+                "explanation": "Violated"
+            }
+        },
+    )
+    repo_mocks["list_evaluations"].return_value = [mock_evaluation]
 
     result = ranker_service.rank_candidates(
         run_id="run_1",
@@ -233,14 +199,13 @@ def test_rank_candidates_hard_constraint_violation(
 
     assert len(result["hard_constraint_violations"]) == 1
     assert "candidate_1" in result["hard_constraint_violations"]
+    assert repo_mocks["append_candidate_provenance_entry"].call_count == 1
 
 
 def test_generate_ranking_explanation_clear_winner(ranker_service, sample_problem_spec):
     """Test explanation generation for clear winner candidate (high I, no violations)."""
     # Create a high-performing candidate
-    candidate = Mock()
-    candidate.id = "candidate_1"
-    candidate.scores = {
+    candidate = SimpleNamespace(id="candidate_1", scores={
         "I": 2.5,
         "P": {"overall": 0.9},
         "R": {"overall": 0.36},
@@ -248,7 +213,7 @@ def test_generate_ranking_explanation_clear_winner(ranker_service, sample_proble
             "constraint_1": {"satisfied": True, "score": 0.95},
             "constraint_2": {"satisfied": True, "score": 0.85}
         }
-    }
+    })
     
     # Create ranked candidates list (this candidate is #1)
     all_ranked_candidates = [
@@ -281,16 +246,14 @@ def test_generate_ranking_explanation_clear_winner(ranker_service, sample_proble
 
 def test_generate_ranking_explanation_hard_violation(ranker_service, sample_problem_spec):
     """Test explanation generation for candidate with hard constraint violation."""
-    candidate = Mock()
-    candidate.id = "candidate_1"
-    candidate.scores = {
+    candidate = SimpleNamespace(id="candidate_1", scores={
         "I": 1.2,
         "P": {"overall": 0.6},
         "R": {"overall": 0.5},
         "constraint_satisfaction": {
             "constraint_2": {"satisfied": False, "score": 0.2}  # Hard constraint violated
         }
-    }
+    })
     
     all_ranked_candidates = [
         {"id": "candidate_1", "scores": candidate.scores}
@@ -316,28 +279,24 @@ def test_generate_ranking_explanation_hard_violation(ranker_service, sample_prob
 def test_generate_ranking_explanation_similar_tradeoffs(ranker_service, sample_problem_spec):
     """Test explanation for candidates with similar P/R but different tradeoffs."""
     # Candidate with high P, high R
-    candidate1 = Mock()
-    candidate1.id = "candidate_1"
-    candidate1.scores = {
+    candidate1 = SimpleNamespace(id="candidate_1", scores={
         "I": 1.5,
         "P": {"overall": 0.9},
         "R": {"overall": 0.6},  # Higher R
         "constraint_satisfaction": {
             "constraint_1": {"satisfied": True, "score": 0.95}
         }
-    }
+    })
     
     # Candidate with lower P, lower R
-    candidate2 = Mock()
-    candidate2.id = "candidate_2"
-    candidate2.scores = {
+    candidate2 = SimpleNamespace(id="candidate_2", scores={
         "I": 1.4,
         "P": {"overall": 0.7},
         "R": {"overall": 0.5},  # Lower R
         "constraint_satisfaction": {
             "constraint_1": {"satisfied": True, "score": 0.8}
         }
-    }
+    })
     
     all_ranked_candidates = [
         {"id": "candidate_1", "scores": candidate1.scores},
@@ -361,16 +320,14 @@ def test_generate_ranking_explanation_similar_tradeoffs(ranker_service, sample_p
 
 def test_generate_ranking_explanation_single_candidate(ranker_service, sample_problem_spec):
     """Test explanation generation for single candidate (edge case)."""
-    candidate = Mock()
-    candidate.id = "candidate_1"
-    candidate.scores = {
+    candidate = SimpleNamespace(id="candidate_1", scores={
         "I": 1.5,
         "P": {"overall": 0.8},
         "R": {"overall": 0.53},
         "constraint_satisfaction": {
             "constraint_1": {"satisfied": True, "score": 0.9}
         }
-    }
+    })
     
     all_ranked_candidates = [
         {"id": "candidate_1", "scores": candidate.scores}
@@ -395,21 +352,18 @@ def test_generate_ranking_explanation_single_candidate(ranker_service, sample_pr
 def test_generate_ranking_explanation_missing_constraint_names(ranker_service):
     """Test explanation generation when constraint names are missing (fallback to IDs)."""
     # ProblemSpec with constraint that has no name
-    problem_spec = Mock()
-    problem_spec.constraints = [
+    problem_spec = SimpleNamespace(constraints=[
         {"id": "unknown_constraint", "weight": 100}  # No name field
-    ]
+    ])
     
-    candidate = Mock()
-    candidate.id = "candidate_1"
-    candidate.scores = {
+    candidate = SimpleNamespace(id="candidate_1", scores={
         "I": 1.0,
         "P": {"overall": 0.7},
         "R": {"overall": 0.7},
         "constraint_satisfaction": {
             "unknown_constraint": {"satisfied": False, "score": 0.3}
         }
-    }
+    })
     
     all_ranked_candidates = [
         {"id": "candidate_1", "scores": candidate.scores}
@@ -432,16 +386,14 @@ def test_generate_ranking_explanation_missing_constraint_names(ranker_service):
 
 def test_generate_ranking_explanation_all_rejected(ranker_service, sample_problem_spec):
     """Test explanation generation when all candidates are rejected (edge case)."""
-    candidate = Mock()
-    candidate.id = "candidate_1"
-    candidate.scores = {
+    candidate = SimpleNamespace(id="candidate_1", scores={
         "I": 0.5,
         "P": {"overall": 0.4},
         "R": {"overall": 0.8},
         "constraint_satisfaction": {
             "constraint_2": {"satisfied": False, "score": 0.2}  # Hard violation
         }
-    }
+    })
     
     all_ranked_candidates = [
         {"id": "candidate_1", "scores": candidate.scores}
@@ -464,9 +416,7 @@ def test_generate_ranking_explanation_all_rejected(ranker_service, sample_proble
 
 def test_generate_ranking_explanation_with_ranking_factors(ranker_service, sample_problem_spec):
     """Test that ranking factors are properly limited and prioritized."""
-    candidate = Mock()
-    candidate.id = "candidate_1"
-    candidate.scores = {
+    candidate = SimpleNamespace(id="candidate_1", scores={
         "I": 2.0,
         "P": {"overall": 0.95},  # Very high P
         "R": {"overall": 0.3},   # Very low R
@@ -474,7 +424,7 @@ def test_generate_ranking_explanation_with_ranking_factors(ranker_service, sampl
             "constraint_1": {"satisfied": True, "score": 0.95},
             "constraint_2": {"satisfied": True, "score": 0.9}
         }
-    }
+    })
     
     all_ranked_candidates = [
         {"id": "candidate_1", "scores": candidate.scores},
@@ -2,6 +2,8 @@
 Unit tests for RunPreflightService.
 """
 
+import pytest
+
 from crucible.services.run_preflight_service import RunPreflightService
 from crucible.db.repositories import (
     create_project,
@@ -11,6 +13,22 @@ from crucible.db.repositories import (
 from crucible.models.run_contracts import RunBlockerCode, RunWarningCode
 
 
+@pytest.fixture(scope="class")
+def ready_project(class_db_session):
+    """Project with a ProblemSpec and WorldModel, shared by every test in a class."""
+    project = create_project(class_db_session, "Preflight Ready", "desc")
+    create_problem_spec(
+        class_db_session,
+        project.id,
+        constraints=[],
+        goals=[],
+        resolution="medium",
+        mode="full_search",
+    )
+    create_world_model(class_db_session, project.id, model_data={})
+    return project
+
+
 class TestRunPreflightService:
     """Validate readiness and warning logic for run preflight."""
 
@@ -30,21 +48,10 @@ class TestRunPreflightService:
         assert result.prerequisites["problem_spec"] is False
         assert result.prerequisites["world_model"] is False
 
-    def test_preflight_ready_when_prerequisites_exist(self, test_db_session):
-        project = create_project(test_db_session, "Preflight Ready", "desc")
-        create_problem_spec(
-            test_db_session,
-            project.id,
-            constraints=[],
-            goals=[],
-            resolution="medium",
-            mode="full_search",
-        )
-        create_world_model(test_db_session, project.id, model_data={})
-
+    def test_preflight_ready_when_prerequisites_exist(self, test_db_session, ready_project):
         service = RunPreflightService(test_db_session)
         result = service.preflight(
-            project_id=project.id,
+            project_id=ready_project.id,
             mode="full_search",
             parameters={"num_candidates": 3, "num_scenarios": 4},
         )
@@ -55,21 +62,10 @@ class TestRunPreflightService:
         assert result.prerequisites["world_model"] is True
         assert result.normalized_config["num_candidates"] == 3
 
-    def test_preflight_warns_on_large_candidate_counts(self, test_db_session):
-        project = create_project(test_db_session, "Preflight Warn", "desc")
-        create_problem_spec(
-            test_db_session,
-            project.id,
-            constraints=[],
-            goals=[],
-            resolution="medium",
-            mode="full_search",
-        )
-        create_world_model(test_db_session, project.id, model_data={})
-
+    def test_preflight_warns_on_large_candidate_counts(self, test_db_session, ready_project):
         service = RunPreflightService(test_db_session)
         result = service.preflight(
-            project_id=project.id,
+            project_id=ready_project.id,
             mode="full_search",
             parameters={"num_candidates": 25, "num_scenarios": 8},
         )
@@ -83,7 +83,8 @@ class TestCaptureSnapshotData:
             {"name": "provenance_log"}
         ])
         
-        with patch('sqlalchemy.inspect') as mock_inspect:
+        with patch('sqlalchemy.inspect') as mock_inspect, \
+             patch('crucible.services.snapshot_service.list_chat_sessions', return_value=[]):
             mock_inspect.return_value = inspector
             
             # Mock SQL results
@@ -127,7 +128,8 @@ class TestCaptureSnapshotData:
         ])
         
         with patch('sqlalchemy.inspect') as mock_inspect, \
-             patch('crucible.services.snapshot_service.get_run') as mock_get_run:
+             patch('crucible.services.snapshot_service.get_run') as mock_get_run, \
+             patch('crucible.services.snapshot_service.list_chat_sessions', return_value=[]):
             mock_inspect.return_value = inspector
             
             # Mock run
@@ -221,7 +223,8 @@ class TestCaptureReferenceMetrics:
         mock_run.llm_usage = {"total_cost_usd": 0.50}
         mock_run.metrics = {"top_i_score": 0.75}
         
-        with patch('crucible.services.snapshot_service.get_run', return_value=mock_run):
+        with patch('crucible.services.snapshot_service.get_run', return_value=mock_run), \
+             patch('crucible.services.snapshot_service.get_run_statistics', return_value={}):
             result = snapshot_service.capture_reference_metrics(run_id)
             
             assert result["candidate_count"] == 5